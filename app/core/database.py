@@ -40,6 +40,12 @@ def set_sqlite_pragma(dbapi_connection, connection_record):
     cursor.execute("PRAGMA busy_timeout=30000")
     # Synchronous NORMAL is safer than OFF but faster than FULL
     cursor.execute("PRAGMA synchronous=NORMAL")
+    # Keep temp tables/indices in memory and give bulk syncs a bigger page cache (64MB)
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-65536")
+    # Memory-map up to 256MB of the database file for faster reads
+    cursor.execute("PRAGMA mmap_size=268435456")
+    # Default wal_autocheckpoint (1000 pages) is fine for our sync sizes
     cursor.close()
 
 
@@ -68,6 +74,36 @@ async def init_db():
     print(f"✅ Database initialized at {DATABASE_PATH}")
 
 
+# Status-derived candidate flags, kept in the schema so every writer agrees.
+# The update trigger only fires when candidate_status is written, so flags set
+# by hand (e.g. flag-pending-docs) survive until the next status sync.
+_CANDIDATE_FLAGS_UPDATE = """
+    UPDATE candidates SET
+        needs_training = (
+            instr(lower(coalesce(NEW.candidate_status, '')), 'training') > 0
+            AND instr(lower(coalesce(NEW.candidate_status, '')), 'completed') = 0
+        ),
+        has_pending_documents = (
+            instr(lower(coalesce(NEW.candidate_status, '')), 'document') > 0
+            OR instr(lower(coalesce(NEW.candidate_status, '')), 'id verification') > 0
+        )
+    WHERE id = NEW.id;
+"""
+
+CANDIDATE_FLAG_TRIGGERS = {
+    "candidates_status_flags_insert": f"""
+        CREATE TRIGGER IF NOT EXISTS candidates_status_flags_insert
+        AFTER INSERT ON candidates
+        BEGIN {_CANDIDATE_FLAGS_UPDATE} END
+    """,
+    "candidates_status_flags_update": f"""
+        CREATE TRIGGER IF NOT EXISTS candidates_status_flags_update
+        AFTER UPDATE OF candidate_status ON candidates
+        BEGIN {_CANDIDATE_FLAGS_UPDATE} END
+    """,
+}
+
+
 async def _run_migrations(conn):
     """Add missing columns to existing tables (SQLite doesn't support ALTER COLUMN)"""
     # Check if key_phrases column exists in crm_notes table
@@ -83,6 +119,27 @@ async def _run_migrations(conn):
         # Table might not exist yet, that's fine
         print(f"  ⚠️ Migration check: {e}")
 
+    # Triggers that derive candidate flags from candidate_status
+    try:
+        for trigger_sql in CANDIDATE_FLAG_TRIGGERS.values():
+            await conn.execute(text(trigger_sql))
+    except Exception as e:
+        print(f"  ⚠️ Migration check: {e}")
+
+    # create_all skips existing tables, so indexes added to a model later
+    # have to be created separately
+    await conn.run_sync(_create_missing_indexes)
+
+
+def _create_missing_indexes(sync_conn):
+    """Create any model index that does not exist yet"""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                index.create(sync_conn, checkfirst=True)
+            except Exception as e:
+                print(f"  ⚠️ Migration check: {e}")
+
 
 async def get_db() -> AsyncSession:
     """Dependency to get database session"""
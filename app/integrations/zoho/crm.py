@@ -109,7 +109,8 @@ class ZohoAPI:
         page: int = 1,
         per_page: int = 200,
         fields: Optional[List[str]] = None,
-        criteria: Optional[str] = None
+        criteria: Optional[str] = None,
+        modified_since: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Get records from a Zoho CRM module with pagination.
@@ -120,12 +121,18 @@ class ZohoAPI:
             per_page: Records per page (max 200)
             fields: Optional list of field names to retrieve
             criteria: Optional COQL criteria string
+            modified_since: ISO timestamp to fetch only records modified after this time
+                           Format: 2024-01-01T00:00:00+00:00
 
         Returns:
             Dict with 'data' list and 'info' pagination details
         """
         headers = await self._get_headers()
 
+        # Add If-Modified-Since header for incremental sync
+        if modified_since:
+            headers["If-Modified-Since"] = modified_since
+
         params = {
             "page": page,
             "per_page": min(per_page, 200)
@@ -150,14 +157,14 @@ class ZohoAPI:
                     params=params,
                 )
 
-            # Handle 204 No Content (no records)
-            if response.status_code == 204:
+            # Handle 204 No Content (no records) or 304 Not Modified
+            if response.status_code in (204, 304):
                 return {"data": [], "info": {"more_records": False}}
 
             response.raise_for_status()
             return response.json()
         except httpx.HTTPError as e:
-            if hasattr(e, 'response') and e.response and e.response.status_code == 204:
+            if hasattr(e, 'response') and e.response and e.response.status_code in (204, 304):
                 return {"data": [], "info": {"more_records": False}}
             raise Exception(f"Failed to get records from {module}: {str(e)}")
 
@@ -300,7 +307,8 @@ class ZohoAPI:
         module: str,
         record_id: str,
         page: int = 1,
-        per_page: int = 100
+        per_page: int = 100,
+        modified_since: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Get emails for a specific record from Zoho CRM.
@@ -310,12 +318,17 @@ class ZohoAPI:
             record_id: The record ID
             page: Page number (starts at 1)
             per_page: Records per page (max 200)
+            modified_since: ISO timestamp to fetch only emails newer than this time
+                           Format: 2024-01-01T00:00:00+00:00
 
         Returns:
             Dict with 'data' list of emails and 'info' pagination details
         """
         headers = await self._get_headers()
 
+        if modified_since:
+            headers["If-Modified-Since"] = modified_since
+
         params = {
             "page": page,
             "per_page": min(per_page, 200)
@@ -328,15 +341,15 @@ class ZohoAPI:
                 params=params,
             )
 
-            # Handle 204 No Content (no emails)
-            if response.status_code == 204:
+            # Handle 204 No Content (no emails) or 304 Not Modified
+            if response.status_code in (204, 304):
                 return {"data": [], "info": {"more_records": False}}
 
             response.raise_for_status()
             return response.json()
         except httpx.HTTPError as e:
             if hasattr(e, "response") and e.response:
-                if e.response.status_code in (204, 404):
+                if e.response.status_code in (204, 304, 404):
                     return {"data": [], "info": {"more_records": False}}
             raise Exception(f"Failed to get emails for {module}/{record_id}: {str(e)}")
 
@@ -1286,7 +1299,7 @@ def _process_candidate_for_sidebar(record: dict) -> dict:
     # Check if unresponsive based on last activity
     if candidate["last_communication_date"]:
         try:
-            last_date = datetime.fromisoformat(candidate["last_communication_date"].replace("Z", "+00:00"))
+            last_date = datetime.fromisoformat(candidate["last_communication_date"])
             days_since = (datetime.now(last_date.tzinfo) - last_date).days
             if days_since >= 7:
                 candidate["status_indicators"].append("unresponsive")
@@ -4,7 +4,7 @@ Local cache and tracking for operations data
 """
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, Integer, DateTime, Text, Boolean, Float, Enum as SQLEnum
+from sqlalchemy import String, Integer, DateTime, Text, Boolean, Float, Index, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column
 from app.core.database import Base
 import enum
@@ -292,6 +292,10 @@ class SyncLog(Base):
     Helps avoid redundant API calls.
     """
     __tablename__ = "sync_logs"
+    __table_args__ = (
+        # Latest completed run per sync type, read straight from the index
+        Index("idx_sync_log_type_status_completed", "sync_type", "status", "completed_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     sync_type: Mapped[str] = mapped_column(String(50), index=True)
@@ -308,7 +312,7 @@ class SyncLog(Base):
 
     # Status
     status: Mapped[str] = mapped_column(String(30), default="running")
-    # statuses: running, completed, failed
+    # statuses: running, completed, partial (finished with errors), failed
     error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     def __repr__(self):
@@ -363,6 +367,10 @@ class CandidateEmail(Base):
     - AI analysis for follow-up recommendations
     """
     __tablename__ = "candidate_emails"
+    __table_args__ = (
+        # A candidate's emails newest-first without a sort
+        Index("idx_cand_email_cand_sent", "zoho_candidate_id", "sent_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
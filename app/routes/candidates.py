@@ -1114,11 +1114,11 @@ async def get_email_content(
         # If cached as plain text, re-fetch to get HTML
 
     # Fetch content from Zoho
-    from app.integrations.zoho.crm import ZohoCRM
+    from app.integrations.zoho.crm import get_zoho_api
     from app.services.sync import SyncService
 
     try:
-        crm = ZohoCRM()
+        crm = await get_zoho_api()
         email_data = await crm.get_email_content(
             module=candidate.zoho_module,
             record_id=candidate.zoho_id,
@@ -89,13 +89,16 @@ async def update_sync_interval(
 
 
 @router.post("/candidates")
-async def sync_candidates():
+async def sync_candidates(
+    full_sync: bool = Query(False, description="If True, fetch all leads regardless of last sync time")
+):
     """
     Sync candidates from Zoho CRM Leads module to local database.
     Maps Zoho CRM fields to local pipeline stages.
+    Uses modified_since for incremental sync by default.
     """
     try:
-        stats = await SyncService.sync_candidates_from_zoho()
+        stats = await SyncService.sync_candidates_from_zoho(full_sync=full_sync)
         return {
             "success": True,
             "message": "Sync completed",
@@ -186,32 +189,14 @@ async def sync_emails(
 @router.get("/status")
 async def get_sync_status():
     """Get the status of the last sync for candidates, interviews, tasks, notes, and emails"""
-    last_candidate_sync = await SyncService.get_last_sync()
-    last_interview_sync = await SyncService.get_last_interview_sync()
-    last_task_sync = await SyncService.get_last_task_sync()
-    last_notes_sync = await SyncService.get_last_notes_sync()
-    last_email_sync = await SyncService.get_last_email_sync()
+    sync_types = ["candidates", "interviews", "tasks", "notes", "emails"]
+    last_syncs = await SyncService.get_last_sync_times(sync_types)
     return {
-        "candidates": {
-            "last_sync": last_candidate_sync.isoformat() if last_candidate_sync else None,
-            "status": "ok" if last_candidate_sync else "never_synced"
-        },
-        "interviews": {
-            "last_sync": last_interview_sync.isoformat() if last_interview_sync else None,
-            "status": "ok" if last_interview_sync else "never_synced"
-        },
-        "tasks": {
-            "last_sync": last_task_sync.isoformat() if last_task_sync else None,
-            "status": "ok" if last_task_sync else "never_synced"
-        },
-        "notes": {
-            "last_sync": last_notes_sync.isoformat() if last_notes_sync else None,
-            "status": "ok" if last_notes_sync else "never_synced"
-        },
-        "emails": {
-            "last_sync": last_email_sync.isoformat() if last_email_sync else None,
-            "status": "ok" if last_email_sync else "never_synced"
+        sync_type: {
+            "last_sync": last_syncs[sync_type].isoformat() if sync_type in last_syncs else None,
+            "status": "ok" if sync_type in last_syncs else "never_synced"
         }
+        for sync_type in sync_types
     }
 
 
@@ -234,10 +219,10 @@ async def debug_zoho_data():
     Debug endpoint to see raw Zoho CRM data for a few leads.
     Shows what fields Zoho is actually returning.
     """
-    from app.integrations.zoho.crm import ZohoCRM
+    from app.integrations.zoho.crm import get_zoho_api
 
     try:
-        crm = ZohoCRM()
+        crm = await get_zoho_api()
         response = await crm.get_records(
             module="Leads",
             page=1,
@@ -264,10 +249,10 @@ async def debug_zoho_events():
     Debug endpoint to see raw Zoho CRM Events data.
     Shows what interview events Zoho is returning.
     """
-    from app.integrations.zoho.crm import ZohoCRM
+    from app.integrations.zoho.crm import get_zoho_api
 
     try:
-        crm = ZohoCRM()
+        crm = await get_zoho_api()
         response = await crm.get_records(
             module="Events",
             page=1,
@@ -385,10 +370,10 @@ async def debug_zoho_emails(
     """
     Debug endpoint to check raw Zoho CRM Emails data for a specific record.
     """
-    from app.integrations.zoho.crm import ZohoCRM
+    from app.integrations.zoho.crm import get_zoho_api
 
     try:
-        crm = ZohoCRM()
+        crm = await get_zoho_api()
 
         # Try to get emails for this record
         response = await crm.get_emails_for_record(
@@ -427,10 +412,10 @@ async def debug_email_content(
     """
     Debug endpoint to check raw Zoho CRM single email content.
     """
-    from app.integrations.zoho.crm import ZohoCRM
+    from app.integrations.zoho.crm import get_zoho_api
 
     try:
-        crm = ZohoCRM()
+        crm = await get_zoho_api()
 
         # Get single email content
         response = await crm.get_email_content(
@@ -461,10 +446,10 @@ async def debug_zoho_tasks():
     Debug endpoint to check Zoho CRM Tasks module access.
     Shows available fields and sample task data.
     """
-    from app.integrations.zoho.crm import ZohoCRM
+    from app.integrations.zoho.crm import get_zoho_api
 
     try:
-        crm = ZohoCRM()
+        crm = await get_zoho_api()
 
         # Try to get tasks - common fields in Zoho CRM Tasks module
         response = await crm.get_records(
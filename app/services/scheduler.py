@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import Optional, Dict, Any
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
+from apscheduler.triggers.cron import CronTrigger
 from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR
 
 from app.services.sync import SyncService
@@ -25,6 +26,11 @@ class SchedulerService:
     _last_sync_time: Optional[datetime] = None
     _last_sync_error: Optional[str] = None
     _sync_in_progress: bool = False
+    # Nightly full candidate/notes sync (UTC hour) that repairs anything the
+    # incremental runs missed and refreshes last_synced on every lead
+    _full_sync_hour: int = 3
+    _full_sync_pending: bool = False
+    _last_full_sync_time: Optional[datetime] = None
 
     @classmethod
     def get_instance(cls) -> "SchedulerService":
@@ -49,6 +55,12 @@ class SchedulerService:
         else:
             print(f"[Scheduler] Job {event.job_id} completed successfully")
 
+    async def _full_sync_job(self):
+        """Nightly job - runs the next sync as a full candidate and notes sync"""
+        # Stays pending if a sync is already running, so the next run picks it up
+        SchedulerService._full_sync_pending = True
+        await self._sync_job()
+
     async def _sync_job(self):
         """The actual sync job that runs on schedule - syncs candidates, interviews, tasks, notes, and emails"""
         if SchedulerService._sync_in_progress:
@@ -57,13 +69,14 @@ class SchedulerService:
 
         SchedulerService._sync_in_progress = True
         SchedulerService._last_sync_error = None
+        full_sync = SchedulerService._full_sync_pending
 
         try:
-            print(f"[Scheduler] Starting auto-sync at {datetime.utcnow().isoformat()}")
+            print(f"[Scheduler] Starting {'full' if full_sync else 'auto'}-sync at {datetime.utcnow().isoformat()}")
 
             # Sync candidates
             print("[Scheduler] Syncing candidates...")
-            candidate_result = await SyncService.sync_candidates_from_zoho()
+            candidate_result = await SyncService.sync_candidates_from_zoho(full_sync=full_sync)
 
             # Sync interviews
             print("[Scheduler] Syncing interviews...")
@@ -73,9 +86,9 @@ class SchedulerService:
             print("[Scheduler] Syncing tasks...")
             task_result = await SyncService.sync_tasks_from_zoho()
 
-            # Sync notes (incremental - uses modified_since)
+            # Sync notes (incremental - uses modified_since - except for the nightly full sync)
             print("[Scheduler] Syncing notes...")
-            notes_result = await SyncService.sync_notes_from_zoho(full_sync=False)
+            notes_result = await SyncService.sync_notes_from_zoho(full_sync=full_sync)
 
             # Sync emails (last 30 days for active candidates)
             # This is more intensive, so we limit to recent emails only
@@ -118,6 +131,9 @@ class SchedulerService:
 
             SchedulerService._last_sync_result = result
             SchedulerService._last_sync_time = datetime.utcnow()
+            if full_sync:
+                SchedulerService._full_sync_pending = False
+                SchedulerService._last_full_sync_time = SchedulerService._last_sync_time
 
             print(f"[Scheduler] Auto-sync completed: "
                   f"Candidates ({candidate_result['records_processed']}), "
@@ -155,6 +171,15 @@ class SchedulerService:
             replace_existing=True
         )
 
+        # Add the nightly full sync job
+        SchedulerService._scheduler.add_job(
+            self._full_sync_job,
+            trigger=CronTrigger(hour=SchedulerService._full_sync_hour, timezone="UTC"),
+            id="full_sync_zoho",
+            name="Nightly Full Sync from Zoho CRM",
+            replace_existing=True
+        )
+
         # Start the scheduler
         SchedulerService._scheduler.start()
         SchedulerService._is_running = True
@@ -207,10 +232,14 @@ class SchedulerService:
     def get_status(self) -> Dict[str, Any]:
         """Get current scheduler status"""
         next_run = None
+        next_full_run = None
         if SchedulerService._scheduler and SchedulerService._is_running:
             job = SchedulerService._scheduler.get_job("auto_sync_zoho")
             if job and job.next_run_time:
                 next_run = job.next_run_time.isoformat()
+            full_job = SchedulerService._scheduler.get_job("full_sync_zoho")
+            if full_job and full_job.next_run_time:
+                next_full_run = full_job.next_run_time.isoformat()
 
         return {
             "is_running": SchedulerService._is_running,
@@ -219,7 +248,9 @@ class SchedulerService:
             "last_sync_time": SchedulerService._last_sync_time.isoformat() if SchedulerService._last_sync_time else None,
             "last_sync_result": SchedulerService._last_sync_result,
             "last_sync_error": SchedulerService._last_sync_error,
-            "next_sync_time": next_run
+            "next_sync_time": next_run,
+            "last_full_sync_time": SchedulerService._last_full_sync_time.isoformat() if SchedulerService._last_full_sync_time else None,
+            "next_full_sync_time": next_full_run
         }
 
     def update_interval(self, interval_minutes: int):
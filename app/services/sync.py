@@ -2,14 +2,197 @@
 Alfa Operations Platform - Data Sync Service
 Synchronizes data from Zoho CRM to local SQLite database
 """
+import asyncio
+import re
+import threading
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
-from sqlalchemy import select
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Callable, Awaitable, Tuple
+from sqlalchemy import select, update, case, cast, func, or_, Integer
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import async_session
 from app.models.database_models import CandidateCache, Interview, Task, SyncLog
-from app.integrations.zoho.crm import ZohoCRM
+from app.integrations.zoho.crm import ZohoCRM, get_zoho_api
+
+
+# Event titles that indicate an interview ("auto interview" is covered by "interview")
+_INTERVIEW_TITLE_RE = re.compile(
+    r"interview|screening|candidate call|hiring call|recruitment call|phone screen",
+    re.IGNORECASE,
+)
+
+# HTML cleanup patterns for CRM note content (see SyncService.strip_html)
+_HTML_SCRIPT_RE = re.compile(r'<script[^>]*>.*?</script>', re.DOTALL | re.IGNORECASE)
+_HTML_STYLE_RE = re.compile(r'<style[^>]*>.*?</style>', re.DOTALL | re.IGNORECASE)
+_HTML_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+_SENTENCE_BREAK_RE = re.compile(r'(?<=[.!?])\s+')
+
+_RAKE_LOCK = threading.Lock()
+
+# Short words RAKE occasionally returns as phrases on their own
+_KEY_PHRASE_STOPWORDS = frozenset({'the', 'and', 'for', 'with', 'this', 'that', 'from'})
+
+# Notes below either limit are too short for RAKE to find meaningful phrases
+_KEY_PHRASE_MIN_LENGTH = 60
+_KEY_PHRASE_MIN_SPACES = 8
+
+
+@lru_cache(maxsize=1)
+def _get_rake():
+    """
+    Shared RAKE extractor, built on first use (Rake() loads the NLTK stopword
+    list from disk). extract_keywords_from_text resets its state on every call.
+    """
+    from rake_nltk import Rake
+
+    return Rake(
+        min_length=1,
+        max_length=3,
+        include_repeated_phrases=False
+    )
+
+
+# Bound-parameter limit of older SQLite builds (SQLITE_MAX_VARIABLE_NUMBER before 3.32)
+SQLITE_MAX_VARIABLES = 999
+
+
+def _chunked(items: List[Any], size: int):
+    """Yield successive slices of at most `size` items"""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+# Zoho date and datetime strings start with YYYY-MM-DD
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+
+# Zoho's usual shapes: "2024-01-15" and "2024-01-15T10:30:00+05:30" (offset or Z optional)
+_ZOHO_DATE_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
+_ZOHO_DATETIME_RE = re.compile(
+    r"^(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?(?:Z|[+-]\d{2}:?\d{2})?$"
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> Optional[datetime]:
+    """
+    Parse an ISO date/datetime string to a naive datetime in the string's own
+    wall-clock time (cached: timestamps repeat across records).
+
+    Common Zoho shapes are matched by regex and built directly; anything else
+    goes through datetime.fromisoformat.
+    """
+    m = _ZOHO_DATETIME_RE.match(value)
+    if m is None:
+        m = _ZOHO_DATE_RE.match(value)
+    if m is not None:
+        year, month, day, *clock = m.groups()
+        hour, minute, second, fraction = clock or (0, 0, 0, None)
+        try:
+            return datetime(
+                int(year), int(month), int(day), int(hour), int(minute), int(second),
+                int(fraction.ljust(6, "0")) if fraction else 0
+            )
+        except ValueError:
+            return None
+
+    if not _ISO_DATE_RE.match(value):
+        return None
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00").replace(" ", "T"))
+    except ValueError:
+        return None
+    return dt.replace(tzinfo=None) if dt.tzinfo else dt
+
+
+@lru_cache(maxsize=4096)
+def _parse_zoho_date_str(value: str) -> Optional[datetime]:
+    """Parse a Zoho Leads date string: ISO first, then MM/DD/YY HH:MM"""
+    if _ISO_DATE_RE.match(value):
+        return _parse_iso(value)
+    try:
+        return datetime.strptime(value, "%m/%d/%y %H:%M")
+    except ValueError:
+        return None
+
+
+def _parse_zoho_date(value) -> Optional[datetime]:
+    """Parse a date value from a Zoho Leads record"""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        return _parse_zoho_date_str(value)
+    return None
+
+
+def _parse_zoho_bool(value) -> Optional[bool]:
+    """Parse a Zoho checkbox/boolean value"""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.lower() in ("true", "yes", "1")
+    return bool(value)
+
+
+_TO_STRING_BY_TYPE = {
+    str: lambda value: value or None,
+    # Join list items with semicolon
+    list: lambda value: "; ".join(str(v) for v in value if v),
+    # Get 'name' key if exists, else first string value
+    dict: lambda value: value.get("name") or value.get("id") or str(value),
+}
+
+
+def _to_string(value) -> Optional[str]:
+    """Convert value to string, handling lists and dicts"""
+    if value is None:
+        return None
+    convert = _TO_STRING_BY_TYPE.get(type(value))
+    if convert is None:
+        return str(value) if value else None
+    return convert(value)
+
+
+def _ref(data: Dict[str, Any], key: str, field: str = "id") -> Optional[str]:
+    """
+    Read a field from a Zoho lookup value.
+
+    Lookups are usually dicts like {"id": ..., "name": ...}; a bare value is
+    returned as a string.
+
+    Args:
+        data: Zoho record
+        key: Lookup field name (e.g. "Owner", "What_Id")
+        field: Key to read when the lookup is a dict
+
+    Returns:
+        The field value, or None if the lookup is missing
+    """
+    value = data.get(key)
+    if type(value) is dict:
+        return value.get(field)
+    return str(value) if value else None
+
+
+def _email_address(value) -> str:
+    """Address from a Zoho email participant ({"email": ...} or a plain string)"""
+    if type(value) is dict:
+        return value.get("email", "") or value.get("Email", "")
+    return str(value) if value else ""
+
+
+def _email_addresses(value) -> str:
+    """Addresses from a Zoho participant list (or single participant), '; '-joined"""
+    if type(value) is list:
+        return "; ".join(filter(None, map(_email_address, value)))
+    return _email_address(value)
 
 
 class SyncService:
@@ -84,46 +267,170 @@ class SyncService:
         "Junk Lead": "Rejected",
     }
 
+    # Same map keyed by lowercased/stripped status, so casing drift is still a direct hit
+    _STATUS_MAP_LC = {k.lower().strip(): v for k, v in STATUS_TO_STAGE_MAP.items()}
+
     @classmethod
     def map_status_to_stage(cls, candidate_status: str) -> str:
         """Map Zoho Candidate Status to our pipeline stage"""
         if not candidate_status:
             return "New Candidate"
 
+        return cls._map_normalized_status(candidate_status.lower().strip())
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _map_normalized_status(cls, status_lower: str) -> str:
+        """
+        Map a lowercased, stripped status to a stage.
+        Cached: Zoho statuses come from a small fixed vocabulary.
+        """
         # Direct mapping
-        if candidate_status in cls.STATUS_TO_STAGE_MAP:
-            return cls.STATUS_TO_STAGE_MAP[candidate_status]
+        return cls._STATUS_MAP_LC.get(status_lower) or cls._partial_match(status_lower)
 
+    @classmethod
+    def _partial_match(cls, candidate_status: str) -> str:
+        """Map a lowercased status missing from STATUS_TO_STAGE_MAP by keyword"""
         # Check for partial matches (for statuses with extra text)
-        status_lower = candidate_status.lower()
-        if "tier 1" in status_lower:
-            return "Active"
-        if "tier 2" in status_lower:
-            return "Active"
-        if "tier 3" in status_lower:
+        if "tier 1" in candidate_status or "tier 2" in candidate_status or "tier 3" in candidate_status:
             return "Active"
-        if "interview" in status_lower:
+        if "interview" in candidate_status:
             return "Interview Scheduled"
-        if "screening" in status_lower:
+        if "screening" in candidate_status:
             return "Screening"
-        if "assessment" in status_lower or "language" in status_lower:
+        if "assessment" in candidate_status or "language" in candidate_status:
             return "Assessment"
-        if "training" in status_lower:
+        if "training" in candidate_status:
             return "Onboarding"
-        if "onboarding" in status_lower or "document" in status_lower:
+        if "onboarding" in candidate_status or "document" in candidate_status:
             return "Onboarding"
-        if "lost" in status_lower or "declined" in status_lower:
+        if "lost" in candidate_status or "declined" in candidate_status:
             return "Inactive"
-        if "qualified" in status_lower and "not" not in status_lower:
+        if "qualified" in candidate_status and "not" not in candidate_status:
             return "Screening"
 
         # Default to New Candidate if unknown
         return "New Candidate"
 
     @classmethod
-    async def sync_candidates_from_zoho(cls) -> Dict[str, Any]:
+    async def _run_page_pipeline(
+        cls,
+        fetch_page: Callable[[int], Awaitable[Dict[str, Any]]],
+        write_page: Callable[[List[Dict[str, Any]]], Awaitable[None]],
+        on_write_error: Callable[[int, Exception], None],
+        max_pages: Optional[int] = None
+    ):
+        """
+        Page through a Zoho module, writing each page as it arrives.
+        A producer fetches up to two pages ahead while the consumer writes,
+        so Zoho round-trips overlap with SQLite work.
+
+        Args:
+            fetch_page: Fetches a page by number and returns the Zoho response
+                (an exception here stops the pipeline and is re-raised)
+            write_page: Writes a list of records; it should only update stats once
+                the write has succeeded, as a failed page is retried record by record
+            on_write_error: Called with (page, exception) for each record that
+                still fails on its own; later pages are still written
+            max_pages: Optional safety limit on the number of pages fetched
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+
+        async def produce():
+            page = 1
+            cancelled = False
+            try:
+                while True:
+                    response = await fetch_page(page)
+                    records = response.get("data", [])
+                    if not records:
+                        break
+
+                    await queue.put((page, records))
+
+                    # Check if more pages exist
+                    info = response.get("info", {})
+                    if not info.get("more_records", False):
+                        break
+
+                    page += 1
+
+                    # Safety limit
+                    if max_pages and page > max_pages:
+                        print(f"⚠️ Reached page limit ({max_pages})")
+                        break
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            finally:
+                # Once cancelled the consumer is gone, and nobody would drain the queue
+                if not cancelled:
+                    await queue.put(None)
+
+        async def consume():
+            # Keep draining the queue even if a page fails, so the producer never blocks
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                page, records = item
+                try:
+                    await write_page(records)
+                except Exception as e:
+                    if len(records) == 1:
+                        on_write_error(page, e)
+                        continue
+
+                    # One bad record fails the whole batch, so fall back to
+                    # writing this page a record at a time
+                    print(f"⚠️ Batch write of page {page} failed, retrying record by record: {str(e)[:100]}")
+                    for record in records:
+                        try:
+                            await write_page([record])
+                        except Exception as record_error:
+                            on_write_error(page, record_error)
+
+        producer = asyncio.create_task(produce())
+        try:
+            await consume()
+        finally:
+            # Still running only if the consumer stopped early, in which case it
+            # may be blocked on a full queue forever
+            if not producer.done():
+                producer.cancel()
+
+        # Surface a fetch error only after the pages already queued were written,
+        # so callers never touch the session mid-write
+        await producer
+
+    # Incremental syncs re-read this much before the start of the last completed
+    # sync, to absorb clock skew between this server and Zoho
+    INCREMENTAL_SYNC_OVERLAP = timedelta(minutes=5)
+
+    # Lead fields requested from Zoho: only the ones _candidate_row_from_zoho reads
+    CANDIDATE_SYNC_FIELDS = (
+        "id", "First_Name", "Last_Name", "Email", "Phone", "Mobile",
+        "Lead_Status", "Tier_Level", "Language", "Other_spoken_language_s",
+        "City", "State", "Country", "Service_Location",
+        "Owner", "Candidate_Recruitment_Owner", "Client", "Agreed_Rate",
+        "Language_Assesment", "Language_Assessment_Graded_By",
+        "Language_Assessment_Completion_Date", "BGV_Passed", "Systems_Check_Approved",
+        "Offer_Accepted", "Offer_accepted_date", "Training_Accepted",
+        "Training_Status", "Training_Start_Date", "Training_End_Date",
+        "Alfa_One_Fully_Onboarded", "abrsmartfollowupextensionforzohocrm__Next_Followup",
+        "abrsmartfollowupextensionforzohocrm__Followup_Reason",
+        "Recontact_Date", "Last_Activity_Time", "Modified_Time", "Created_Time",
+        "Lead_Source", "Disqualification_Reason", "WhatsApp_Number"
+    )
+
+    @classmethod
+    async def sync_candidates_from_zoho(cls, full_sync: bool = False) -> Dict[str, Any]:
         """
         Sync candidates from Zoho CRM Leads module to local database.
+        Uses modified_since for incremental sync unless full_sync is True.
+
+        Args:
+            full_sync: If True, fetch all leads regardless of last sync time
 
         Returns:
             Dict with sync statistics
@@ -141,76 +448,87 @@ class SyncService:
                 "records_processed": 0,
                 "records_created": 0,
                 "records_updated": 0,
+                "records_skipped": 0,
                 "errors": 0,
                 "error_details": []
             }
 
             try:
                 # Initialize Zoho CRM client
-                crm = ZohoCRM()
+                crm = await get_zoho_api()
 
-                # Fetch leads from Zoho CRM
-                # We'll fetch in batches using pagination
-                page = 1
+                # Get last sync time for incremental sync
+                modified_since = None
+                if not full_sync:
+                    last_sync = await cls.get_last_sync()
+                    if last_sync:
+                        # Format as ISO string for Zoho API
+                        modified_since = (last_sync - cls.INCREMENTAL_SYNC_OVERLAP).strftime("%Y-%m-%dT%H:%M:%S+00:00")
+                        print(f"👥 Incremental candidate sync since: {modified_since}")
+                    else:
+                        print("👥 No previous candidate sync found, performing full sync")
+                else:
+                    print("👥 Full candidate sync requested")
+
+                # Fetch leads from Zoho CRM in pages, overlapping fetches with writes
                 per_page = 200
 
-                while True:
+                async def fetch_page(page):
                     try:
-                        response = await crm.get_records(
+                        return await crm.get_records(
                             module="Leads",
                             page=page,
                             per_page=per_page,
-                            fields=[
-                                "id", "First_Name", "Last_Name", "Email", "Phone", "Mobile",
-                                "Lead_Status", "Stage", "Tier_Level", "Language", "Other_spoken_language_s",
-                                "City", "State", "Country", "Service_Location",
-                                "Owner", "Candidate_Recruitment_Owner", "Client", "Agreed_Rate",
-                                "Language_Assesment", "Language_Assessment_Graded_By",
-                                "Language_Assessment_Completion_Date", "BGV_Passed", "Systems_Check_Approved",
-                                "Offer_Accepted", "Offer_accepted_date", "Training_Accepted",
-                                "Training_Status", "Training_Start_Date", "Training_End_Date",
-                                "Alfa_One_Fully_Onboarded", "abrsmartfollowupextensionforzohocrm__Next_Followup",
-                                "abrsmartfollowupextensionforzohocrm__Followup_Reason",
-                                "Recontact_Date", "Last_Activity_Time", "Modified_Time", "Created_Time",
-                                "Lead_Source", "Disqualification_Reason", "WhatsApp_Number"
-                            ]
+                            fields=cls.CANDIDATE_SYNC_FIELDS,
+                            modified_since=modified_since
                         )
-
-                        records = response.get("data", [])
-                        if not records:
-                            break
-
-                        for record in records:
-                            try:
-                                created = await cls._upsert_candidate_from_zoho(db, record)
-                                stats["records_processed"] += 1
-                                if created:
-                                    stats["records_created"] += 1
-                                else:
-                                    stats["records_updated"] += 1
-                            except Exception as e:
-                                print(f"Error processing candidate {record.get('id')}: {e}")
-                                stats["errors"] += 1
-                                stats["error_details"].append(str(e))
-
-                        # Check if more pages exist
-                        info = response.get("info", {})
-                        if not info.get("more_records", False):
-                            break
-
-                        page += 1
-
                     except Exception as e:
                         print(f"Error fetching page {page}: {e}")
                         stats["errors"] += 1
                         stats["error_details"].append(f"Page {page}: {str(e)}")
-                        break
+                        return {}
+
+                def on_write_error(page, e):
+                    print(f"Error writing page {page}: {e}")
+                    stats["errors"] += 1
+                    stats["error_details"].append(f"Page {page}: {str(e)}")
+
+                async def write_page(records):
+                    rows, failures = [], []
+                    now = datetime.utcnow()
+                    for record in records:
+                        try:
+                            row = cls._candidate_row_from_zoho(record, now)
+                            if row:
+                                rows.append(row)
+                        except Exception as e:
+                            failures.append((record.get('id'), e))
+
+                    if rows:
+                        # One explicit transaction per page
+                        async with db.begin():
+                            created, skipped = await cls._upsert_candidates(
+                                db, rows, skip_unchanged=not full_sync
+                            )
+                        stats["records_processed"] += len(rows)
+                        stats["records_created"] += created
+                        stats["records_updated"] += len(rows) - created - skipped
+                        stats["records_skipped"] += skipped
+
+                    # Counted only once the page is written, as a failed page is retried
+                    for record_id, e in failures:
+                        print(f"Error processing candidate {record_id}: {e}")
+                        stats["errors"] += 1
+                        stats["error_details"].append(str(e))
+
+                await cls._run_page_pipeline(fetch_page, write_page, on_write_error)
 
                 # Update days_in_stage for all candidates
                 await cls._update_days_in_stage(db)
 
-                # Mark sync as completed
-                sync_log.status = "completed"
+                # A run that lost pages is partial, so it never becomes the
+                # watermark and the next incremental sync fetches them again
+                sync_log.status = "partial" if stats["errors"] else "completed"
                 sync_log.completed_at = datetime.utcnow()
                 sync_log.records_processed = stats["records_processed"]
                 sync_log.records_created = stats["records_created"]
@@ -228,256 +546,270 @@ class SyncService:
             return stats
 
     @classmethod
-    async def _upsert_candidate_from_zoho(cls, db: AsyncSession, data: Dict[str, Any]) -> bool:
+    def _candidate_row_from_zoho(cls, data: Dict[str, Any], now: datetime) -> Optional[Dict[str, Any]]:
         """
-        Insert or update a candidate record from Zoho CRM data.
+        Build a candidates table row from Zoho CRM data (no database access).
+
+        Args:
+            data: Zoho Leads record
+            now: Sync timestamp shared by every row in the page
 
         Returns:
-            True if created, False if updated
+            Dict of column values, or None if the record has no Zoho ID
         """
         zoho_id = data.get("id")
         if not zoho_id:
-            return False
-
-        # Check if exists
-        result = await db.execute(
-            select(CandidateCache).where(CandidateCache.zoho_id == str(zoho_id))
-        )
-        existing = result.scalar_one_or_none()
-
-        # Parse helper functions
-        def parse_date(value):
-            if not value:
-                return None
-            try:
-                if isinstance(value, datetime):
-                    return value
-                # Try ISO format first
-                return datetime.fromisoformat(value.replace("Z", "+00:00").replace(" ", "T"))
-            except (ValueError, AttributeError):
-                try:
-                    # Try other common formats
-                    return datetime.strptime(value, "%m/%d/%y %H:%M")
-                except:
-                    return None
-
-        def parse_bool(value):
-            if value is None:
-                return None
-            if isinstance(value, bool):
-                return value
-            if isinstance(value, str):
-                return value.lower() in ("true", "yes", "1")
-            return bool(value)
-
-        def to_string(value):
-            """Convert value to string, handling lists and dicts"""
-            if value is None:
-                return None
-            if isinstance(value, list):
-                # Join list items with semicolon
-                return "; ".join(str(v) for v in value if v)
-            if isinstance(value, dict):
-                # Get 'name' key if exists, else first string value
-                return value.get("name") or value.get("id") or str(value)
-            return str(value) if value else None
+            return None
 
         # Build full name
-        first_name = to_string(data.get("First_Name")) or ""
-        last_name = to_string(data.get("Last_Name")) or ""
+        first_name = _to_string(data.get("First_Name")) or ""
+        last_name = _to_string(data.get("Last_Name")) or ""
         full_name = f"{first_name} {last_name}".strip() or "Unknown"
 
         # Get lead status and map to stage
-        lead_status = to_string(data.get("Lead_Status")) or ""
+        lead_status = _to_string(data.get("Lead_Status")) or ""
         stage = cls.map_status_to_stage(lead_status)
 
         # Build languages string
-        primary_lang = to_string(data.get("Language")) or ""
-        other_langs = to_string(data.get("Other_spoken_language_s")) or ""
+        primary_lang = _to_string(data.get("Language")) or ""
+        other_langs = _to_string(data.get("Other_spoken_language_s")) or ""
         languages = primary_lang
         if other_langs:
             languages = f"{primary_lang}; {other_langs}" if primary_lang else other_langs
 
         # Parse dates
-        modified_time = parse_date(data.get("Modified_Time"))
-        created_time = parse_date(data.get("Created_Time"))  # When lead was created in Zoho
-        last_activity = parse_date(data.get("Last_Activity_Time"))
-        next_followup = parse_date(data.get("abrsmartfollowupextensionforzohocrm__Next_Followup"))
-        recontact_date = parse_date(data.get("Recontact_Date"))
-        offer_date = parse_date(data.get("Offer_accepted_date"))
-        training_start = parse_date(data.get("Training_Start_Date"))
-        training_end = parse_date(data.get("Training_End_Date"))
-        la_date = parse_date(data.get("Language_Assessment_Completion_Date"))
+        created_time = _parse_zoho_date(data.get("Created_Time"))  # When lead was created in Zoho
+        last_activity = _parse_zoho_date(data.get("Last_Activity_Time"))
 
         # Get owner names
-        owner_data = data.get("Owner", {})
-        candidate_owner = owner_data.get("name") if isinstance(owner_data, dict) else str(owner_data) if owner_data else None
+        candidate_owner = _ref(data, "Owner", "name")
 
         recruitment_owner_data = data.get("Candidate_Recruitment_Owner", {})
-        recruitment_owner = recruitment_owner_data.get("name") if isinstance(recruitment_owner_data, dict) else to_string(recruitment_owner_data)
+        recruitment_owner = (recruitment_owner_data.get("name") or None) if isinstance(recruitment_owner_data, dict) else _to_string(recruitment_owner_data)
 
-        if existing:
-            # Update existing record
-            old_stage = existing.stage
-
-            existing.first_name = first_name
-            existing.last_name = last_name
-            existing.full_name = full_name
-            existing.email = data.get("Email")
-            existing.phone = data.get("Phone")
-            existing.mobile = data.get("Mobile")
-            existing.whatsapp_number = data.get("WhatsApp_Number")
-
-            existing.city = data.get("City")
-            existing.state = data.get("State")
-            existing.country = data.get("Country")
-            existing.service_location = data.get("Service_Location")
-
-            existing.candidate_status = lead_status
-            existing.stage = stage
-            existing.tier = to_string(data.get("Tier_Level"))
-
-            existing.language = to_string(data.get("Language"))
-            existing.languages = languages
-
-            existing.candidate_owner = candidate_owner
-            existing.recruitment_owner = to_string(recruitment_owner)
-            existing.assigned_client = to_string(data.get("Client"))
-            existing.agreed_rate = to_string(data.get("Agreed_Rate"))
-
-            existing.language_assessment_passed = parse_bool(data.get("Language_Assesment"))
-            existing.language_assessment_grader = to_string(data.get("Language_Assessment_Graded_By"))
-            existing.language_assessment_date = la_date
-            existing.bgv_passed = parse_bool(data.get("BGV_Passed"))
-            existing.system_specs_approved = parse_bool(data.get("Systems_Check_Approved"))
-
-            existing.offer_accepted = parse_bool(data.get("Offer_Accepted"))
-            existing.offer_accepted_date = offer_date
-            existing.training_accepted = parse_bool(data.get("Training_Accepted"))
-            existing.training_status = to_string(data.get("Training_Status"))
-            existing.training_start_date = training_start
-            existing.training_end_date = training_end
-            existing.alfa_one_onboarded = parse_bool(data.get("Alfa_One_Fully_Onboarded"))
-
-            existing.next_followup = next_followup
-            existing.followup_reason = to_string(data.get("abrsmartfollowupextensionforzohocrm__Followup_Reason"))
-            existing.recontact_date = recontact_date
-
-            existing.last_activity_date = last_activity
-            existing.zoho_modified_time = modified_time
-            existing.zoho_created_time = created_time
-            existing.candidate_source = to_string(data.get("Lead_Source"))
-            existing.disqualification_reason = to_string(data.get("Disqualification_Reason"))
-
-            # Update stage tracking if stage changed
-            if old_stage != stage:
-                # Use last_activity as stage entry date when stage changes
-                existing.stage_entered_date = last_activity or datetime.utcnow()
-                existing.days_in_stage = 0
-            # If no stage_entered_date, use created_time (when lead was first added)
-            elif not existing.stage_entered_date:
-                existing.stage_entered_date = created_time or last_activity or datetime.utcnow()
-
-            # Determine flags based on status
-            status_lower = (lead_status or "").lower()
-            existing.needs_training = "training" in status_lower and "completed" not in status_lower
-            existing.has_pending_documents = "document" in status_lower or "id verification" in status_lower
-
-            existing.last_synced = datetime.utcnow()
-            existing.updated_at = datetime.utcnow()
+        return {
+            "zoho_id": str(zoho_id),
+            "zoho_module": "Leads",
+            "first_name": first_name,
+            "last_name": last_name,
+            "full_name": full_name,
+            "email": data.get("Email"),
+            "phone": data.get("Phone"),
+            "mobile": data.get("Mobile"),
+            "whatsapp_number": data.get("WhatsApp_Number"),
+
+            "city": _to_string(data.get("City")),
+            "state": _to_string(data.get("State")),
+            "country": _to_string(data.get("Country")),
+            "service_location": _to_string(data.get("Service_Location")),
+
+            "candidate_status": lead_status,
+            "stage": stage,
+            "tier": _to_string(data.get("Tier_Level")),
+
+            "language": _to_string(data.get("Language")),
+            "languages": languages,
+
+            "candidate_owner": candidate_owner,
+            "recruitment_owner": recruitment_owner,
+            "assigned_client": _to_string(data.get("Client")),
+            "agreed_rate": _to_string(data.get("Agreed_Rate")),
+
+            "language_assessment_passed": _parse_zoho_bool(data.get("Language_Assesment")),
+            "language_assessment_grader": _to_string(data.get("Language_Assessment_Graded_By")),
+            "language_assessment_date": _parse_zoho_date(data.get("Language_Assessment_Completion_Date")),
+            "bgv_passed": _parse_zoho_bool(data.get("BGV_Passed")),
+            "system_specs_approved": _parse_zoho_bool(data.get("Systems_Check_Approved")),
+
+            "offer_accepted": _parse_zoho_bool(data.get("Offer_Accepted")),
+            "offer_accepted_date": _parse_zoho_date(data.get("Offer_accepted_date")),
+            "training_accepted": _parse_zoho_bool(data.get("Training_Accepted")),
+            "training_status": _to_string(data.get("Training_Status")),
+            "training_start_date": _parse_zoho_date(data.get("Training_Start_Date")),
+            "training_end_date": _parse_zoho_date(data.get("Training_End_Date")),
+            "alfa_one_onboarded": _parse_zoho_bool(data.get("Alfa_One_Fully_Onboarded")),
+
+            "next_followup": _parse_zoho_date(data.get("abrsmartfollowupextensionforzohocrm__Next_Followup")),
+            "followup_reason": _to_string(data.get("abrsmartfollowupextensionforzohocrm__Followup_Reason")),
+            "recontact_date": _parse_zoho_date(data.get("Recontact_Date")),
+
+            "last_activity_date": last_activity,
+            "zoho_modified_time": _parse_zoho_date(data.get("Modified_Time")),
+            "zoho_created_time": created_time,
+            "candidate_source": _to_string(data.get("Lead_Source")),
+            "disqualification_reason": _to_string(data.get("Disqualification_Reason")),
+
+            # Use created_time (when lead was added to Zoho) for stage entry
+            "stage_entered_date": created_time or last_activity or now,
+            "days_in_stage": 0,  # Will be calculated by _update_days_in_stage
+            # needs_training / has_pending_documents are set from candidate_status
+            # by the candidates_status_flags_* triggers (see app/core/database.py)
+
+            "last_synced": now,
+            "updated_at": now,
+        }
 
-            return False
+    # Columns only written when a candidate is first inserted
+    _CANDIDATE_INSERT_ONLY = {"zoho_id", "zoho_module", "stage_entered_date", "days_in_stage"}
 
-        else:
-            # Create new record
-            new_candidate = CandidateCache(
-                zoho_id=str(zoho_id),
-                zoho_module="Leads",
-                first_name=first_name,
-                last_name=last_name,
-                full_name=full_name,
-                email=data.get("Email"),
-                phone=data.get("Phone"),
-                mobile=data.get("Mobile"),
-                whatsapp_number=data.get("WhatsApp_Number"),
-
-                city=to_string(data.get("City")),
-                state=to_string(data.get("State")),
-                country=to_string(data.get("Country")),
-                service_location=to_string(data.get("Service_Location")),
-
-                candidate_status=lead_status,
-                stage=stage,
-                tier=to_string(data.get("Tier_Level")),
-
-                language=to_string(data.get("Language")),
-                languages=languages,
-
-                candidate_owner=candidate_owner,
-                recruitment_owner=to_string(recruitment_owner),
-                assigned_client=to_string(data.get("Client")),
-                agreed_rate=to_string(data.get("Agreed_Rate")),
-
-                language_assessment_passed=parse_bool(data.get("Language_Assesment")),
-                language_assessment_grader=to_string(data.get("Language_Assessment_Graded_By")),
-                language_assessment_date=la_date,
-                bgv_passed=parse_bool(data.get("BGV_Passed")),
-                system_specs_approved=parse_bool(data.get("Systems_Check_Approved")),
-
-                offer_accepted=parse_bool(data.get("Offer_Accepted")),
-                offer_accepted_date=offer_date,
-                training_accepted=parse_bool(data.get("Training_Accepted")),
-                training_status=to_string(data.get("Training_Status")),
-                training_start_date=training_start,
-                training_end_date=training_end,
-                alfa_one_onboarded=parse_bool(data.get("Alfa_One_Fully_Onboarded")),
-
-                next_followup=next_followup,
-                followup_reason=to_string(data.get("abrsmartfollowupextensionforzohocrm__Followup_Reason")),
-                recontact_date=recontact_date,
-
-                last_activity_date=last_activity,
-                zoho_modified_time=modified_time,
-                zoho_created_time=created_time,
-                candidate_source=to_string(data.get("Lead_Source")),
-                disqualification_reason=to_string(data.get("Disqualification_Reason")),
-
-                # Use created_time (when lead was added to Zoho) for stage entry
-                stage_entered_date=created_time or last_activity or datetime.utcnow(),
-                days_in_stage=0,  # Will be calculated by _update_days_in_stage
-                needs_training="training" in (lead_status or "").lower() and "completed" not in (lead_status or "").lower(),
-                has_pending_documents="document" in (lead_status or "").lower(),
-                last_synced=datetime.utcnow()
+    @classmethod
+    async def _upsert_candidates(
+        cls,
+        db: AsyncSession,
+        rows: List[Dict[str, Any]],
+        skip_unchanged: bool = False
+    ) -> Tuple[int, int]:
+        """
+        Insert or update a page of candidate rows with a single
+        INSERT ... ON CONFLICT(zoho_id) DO UPDATE statement, executed
+        once per row via executemany (Core, no ORM objects).
+
+        Args:
+            db: Database session
+            rows: Candidate rows from _candidate_row_from_zoho
+            skip_unchanged: If True, rows whose Modified_Time matches the stored
+                row are not rewritten; only their last_synced is bumped
+
+        Returns:
+            Tuple of (rows newly created, unchanged rows skipped)
+        """
+        zoho_ids = [row["zoho_id"] for row in rows]
+
+        # Each IN (...) value is a bound parameter, so keep lookups under SQLite's limit
+        existing_modified = {}
+        for chunk in _chunked(zoho_ids, SQLITE_MAX_VARIABLES):
+            result = await db.execute(
+                select(CandidateCache.zoho_id, CandidateCache.zoho_modified_time)
+                .where(CandidateCache.zoho_id.in_(chunk))
             )
-            db.add(new_candidate)
-            return True
+            existing_modified.update(result.tuples().all())
+        created = sum(1 for zoho_id in zoho_ids if zoho_id not in existing_modified)
+
+        skipped_ids = []
+        if skip_unchanged and existing_modified:
+            changed = []
+            for row in rows:
+                modified_time = row["zoho_modified_time"]
+                if modified_time and existing_modified.get(row["zoho_id"]) == modified_time:
+                    skipped_ids.append(row["zoho_id"])
+                else:
+                    changed.append(row)
+
+            # Unchanged leads were still seen by this sync
+            for chunk in _chunked(skipped_ids, SQLITE_MAX_VARIABLES):
+                await db.execute(
+                    update(CandidateCache)
+                    .where(CandidateCache.zoho_id.in_(chunk))
+                    .values(last_synced=rows[0]["last_synced"])
+                )
+
+            rows = changed
+            if not rows:
+                return created, len(skipped_ids)
+
+        table = CandidateCache.__table__
+        stmt = sqlite_insert(table)
+        excluded = stmt.excluded
+
+        set_ = {
+            name: excluded[name]
+            for name in rows[0]
+            if name not in cls._CANDIDATE_INSERT_ONLY
+        }
+
+        # Update stage tracking if stage changed: use last_activity as stage entry date.
+        # If no stage_entered_date yet, fall back to the insert value (created_time).
+        stage_changed = table.c.stage.is_distinct_from(excluded.stage)
+        set_["stage_entered_date"] = case(
+            (stage_changed, func.coalesce(excluded.last_activity_date, excluded.last_synced)),
+            (table.c.stage_entered_date.is_(None), excluded.stage_entered_date),
+            else_=table.c.stage_entered_date,
+        )
+        set_["days_in_stage"] = case((stage_changed, 0), else_=table.c.days_in_stage)
+
+        # executemany: one compiled statement, the driver streams the parameter sets
+        await db.execute(
+            stmt.on_conflict_do_update(index_elements=[table.c.zoho_id], set_=set_),
+            rows
+        )
+
+        return created, len(skipped_ids)
 
     @classmethod
     async def _update_days_in_stage(cls, db: AsyncSession):
-        """Update days_in_stage for all candidates"""
-        result = await db.execute(select(CandidateCache))
-        candidates = result.scalars().all()
-
+        """Update days_in_stage for all candidates with a single UPDATE statement"""
+        table = CandidateCache.__table__
         now = datetime.utcnow()
-        for candidate in candidates:
-            if candidate.stage_entered_date:
-                delta = now - candidate.stage_entered_date
-                candidate.days_in_stage = delta.days
+        days = cast(func.julianday(now) - func.julianday(table.c.stage_entered_date), Integer)
+
+        # Only touch rows whose value actually changes
+        await db.execute(
+            update(table)
+            .where(table.c.stage_entered_date.is_not(None))
+            .where(table.c.days_in_stage.is_distinct_from(days))
+            .values(days_in_stage=days)
+        )
 
         await db.commit()
 
     @classmethod
     async def get_last_sync(cls) -> Optional[datetime]:
-        """Get the timestamp of the last successful sync"""
+        """Get the start time of the last successful candidate sync (the incremental watermark)"""
+        return await cls.get_sync_watermark("candidates")
+
+    @classmethod
+    async def get_last_sync_times(
+        cls, sync_types: Optional[List[str]] = None
+    ) -> Dict[str, datetime]:
+        """
+        Get the last successful sync timestamp for several sync types at once.
+
+        One grouped MAX(completed_at) query replaces a round-trip per type.
+
+        Args:
+            sync_types: Sync types to look up; None returns every type
+
+        Returns:
+            Dict mapping sync_type to its last completed_at (types that never
+            completed are absent)
+        """
+        query = (
+            select(SyncLog.sync_type, func.max(SyncLog.completed_at))
+            .where(SyncLog.status == "completed")
+            .group_by(SyncLog.sync_type)
+        )
+        if sync_types is not None:
+            query = query.where(SyncLog.sync_type.in_(sync_types))
+
+        async with async_session() as db:
+            result = await db.execute(query)
+            return {
+                sync_type: completed_at
+                for sync_type, completed_at in result.all()
+                if completed_at is not None
+            }
+
+    @classmethod
+    async def get_sync_watermark(cls, sync_type: str) -> Optional[datetime]:
+        """
+        Get the point an incremental sync can safely resume from.
+
+        This is when the last completed run started, not when it finished:
+        records modified in Zoho while that run was paging may not be in it.
+        Partial and failed runs are never used.
+
+        Args:
+            sync_type: Sync type to look up
+
+        Returns:
+            started_at of the latest completed run, or None if none completed
+        """
         async with async_session() as db:
             result = await db.execute(
-                select(SyncLog)
-                .where(SyncLog.sync_type == "candidates", SyncLog.status == "completed")
-                .order_by(SyncLog.completed_at.desc())
-                .limit(1)
+                select(func.max(SyncLog.started_at))
+                .where(SyncLog.sync_type == sync_type, SyncLog.status == "completed")
             )
-            sync_log = result.scalar_one_or_none()
-            return sync_log.completed_at if sync_log else None
+            return result.scalar_one_or_none()
 
     @classmethod
     async def create_sample_data(cls):
@@ -487,7 +819,7 @@ class SyncService:
         """
         async with async_session() as db:
             # Check if we already have data
-            result = await db.execute(select(CandidateCache).limit(1))
+            result = await db.execute(select(CandidateCache.id).limit(1))
             if result.scalar_one_or_none():
                 return {"message": "Data already exists"}
 
@@ -520,22 +852,24 @@ class SyncService:
             ]
 
             now = datetime.utcnow()
+            rows = []
             for i, data in enumerate(sample_candidates):
                 days_back = data.get("days", i % 7)
-                candidate = CandidateCache(
-                    zoho_id=f"SAMPLE_{i+1:04d}",
-                    zoho_module="Leads",
-                    full_name=data["name"],
-                    email=data["email"],
-                    stage=data["stage"],
-                    languages=data["languages"],
-                    stage_entered_date=now - timedelta(days=days_back),
-                    days_in_stage=days_back,
-                    is_unresponsive=data.get("unresponsive", False),
-                    last_synced=now
-                )
-                db.add(candidate)
-
+                rows.append({
+                    "zoho_id": f"SAMPLE_{i+1:04d}",
+                    "zoho_module": "Leads",
+                    "full_name": data["name"],
+                    "email": data["email"],
+                    "stage": data["stage"],
+                    "languages": data["languages"],
+                    "stage_entered_date": now - timedelta(days=days_back),
+                    "days_in_stage": days_back,
+                    "is_unresponsive": data.get("unresponsive", False),
+                    "last_synced": now,
+                })
+
+            # One executemany INSERT instead of an ORM object per candidate
+            await db.execute(sqlite_insert(CandidateCache), rows)
             await db.commit()
             return {"message": f"Created {len(sample_candidates)} sample candidates"}
 
@@ -569,9 +903,12 @@ class SyncService:
 
             try:
                 # Initialize Zoho CRM client
-                crm = ZohoCRM()
+                crm = await get_zoho_api()
 
-                # Fetch events from Zoho CRM (interviews are stored as Events)
+                # Fetch events from Zoho CRM (interviews are stored as Events).
+                # Titles are filtered locally: Zoho search criteria only offer
+                # equals/starts_with on text fields, which can't express the
+                # keyword match in _is_interview_event.
                 page = 1
                 per_page = 200
 
@@ -583,8 +920,7 @@ class SyncService:
                             per_page=per_page,
                             fields=[
                                 "id", "Event_Title", "Subject", "Start_DateTime", "End_DateTime",
-                                "What_Id", "$se_module", "Owner", "Participants",
-                                "Check_In_Status", "Description", "Created_Time", "Modified_Time"
+                                "What_Id", "$se_module", "Owner", "Check_In_Status", "Description"
                             ]
                         )
 
@@ -592,6 +928,7 @@ class SyncService:
                         if not records:
                             break
 
+                        now = datetime.utcnow()
                         for record in records:
                             try:
                                 # Only process events that look like interviews
@@ -599,7 +936,7 @@ class SyncService:
                                 if not cls._is_interview_event(title):
                                     continue
 
-                                created = await cls._upsert_interview_from_zoho(db, record)
+                                created = await cls._upsert_interview_from_zoho(db, record, now)
                                 stats["records_processed"] += 1
                                 if created:
                                     stats["records_created"] += 1
@@ -644,20 +981,20 @@ class SyncService:
     @classmethod
     def _is_interview_event(cls, title: str) -> bool:
         """Check if an event title indicates it's an interview"""
-        if not title:
-            return False
-        title_lower = title.lower()
-        interview_keywords = [
-            "interview", "screening", "auto interview", "candidate call",
-            "hiring call", "recruitment call", "phone screen"
-        ]
-        return any(keyword in title_lower for keyword in interview_keywords)
+        return bool(title) and _INTERVIEW_TITLE_RE.search(title) is not None
 
     @classmethod
-    async def _upsert_interview_from_zoho(cls, db: AsyncSession, data: Dict[str, Any]) -> bool:
+    async def _upsert_interview_from_zoho(
+        cls, db: AsyncSession, data: Dict[str, Any], now: datetime
+    ) -> bool:
         """
         Insert or update an interview record from Zoho CRM event data.
 
+        Args:
+            db: Database session
+            data: Zoho event record
+            now: Current UTC time, shared by every record in a page
+
         Returns:
             True if created, False if updated
         """
@@ -671,25 +1008,10 @@ class SyncService:
         )
         existing = result.scalar_one_or_none()
 
-        # Parse date helpers - strip timezone to naive UTC for consistency
-        def parse_datetime(value):
-            if not value:
-                return None
-            try:
-                if isinstance(value, datetime):
-                    # Strip timezone if present
-                    return value.replace(tzinfo=None) if value.tzinfo else value
-                # Try ISO format
-                dt = datetime.fromisoformat(value.replace("Z", "+00:00").replace(" ", "T"))
-                # Strip timezone to make naive (consistent with rest of codebase)
-                return dt.replace(tzinfo=None) if dt.tzinfo else dt
-            except (ValueError, AttributeError):
-                return None
-
-        # Get event details
+        # Get event details (dates stripped to naive UTC for consistency)
         title = data.get("Event_Title", "") or data.get("Subject", "") or "Interview"
-        start_dt = parse_datetime(data.get("Start_DateTime"))
-        end_dt = parse_datetime(data.get("End_DateTime"))
+        start_dt = cls._parse_datetime(data.get("Start_DateTime"))
+        end_dt = cls._parse_datetime(data.get("End_DateTime"))
 
         if not start_dt:
             return False  # Skip events without a start time
@@ -705,24 +1027,15 @@ class SyncService:
         related_module = data.get("$se_module", "")
 
         # Try to get candidate ID
-        zoho_candidate_id = None
-        candidate_name = "Unknown"
+        zoho_candidate_id = _ref(data, "What_Id")
+        candidate_name = what_id.get("name", "Unknown") if type(what_id) is dict else "Unknown"
         candidate_email = None
 
-        if what_id:
-            if isinstance(what_id, dict):
-                zoho_candidate_id = what_id.get("id")
-                candidate_name = what_id.get("name", "Unknown")
-            else:
-                zoho_candidate_id = str(what_id)
-
         # Get owner as interviewer
-        owner_data = data.get("Owner", {})
-        interviewer = owner_data.get("name") if isinstance(owner_data, dict) else str(owner_data) if owner_data else None
+        interviewer = _ref(data, "Owner", "name")
 
         # Determine interview status from Check_In_Status and date
         check_in_status = data.get("Check_In_Status", "")
-        now = datetime.utcnow()
 
         if check_in_status:
             check_in_lower = str(check_in_status).lower()
@@ -784,7 +1097,7 @@ class SyncService:
             elif not is_no_show:
                 existing.is_no_show = False
             existing.notes = data.get("Description")
-            existing.updated_at = datetime.utcnow()
+            existing.updated_at = now
 
             return False
         else:
@@ -809,15 +1122,7 @@ class SyncService:
     @classmethod
     async def get_last_interview_sync(cls) -> Optional[datetime]:
         """Get the timestamp of the last successful interview sync"""
-        async with async_session() as db:
-            result = await db.execute(
-                select(SyncLog)
-                .where(SyncLog.sync_type == "interviews", SyncLog.status == "completed")
-                .order_by(SyncLog.completed_at.desc())
-                .limit(1)
-            )
-            sync_log = result.scalar_one_or_none()
-            return sync_log.completed_at if sync_log else None
+        return (await cls.get_last_sync_times(["interviews"])).get("interviews")
 
     # ========================================================================
     # TASK SYNC
@@ -842,7 +1147,7 @@ class SyncService:
             await db.commit()
 
             try:
-                crm = ZohoCRM()
+                crm = await get_zoho_api()
                 stats = {
                     "total_fetched": 0,
                     "created": 0,
@@ -850,13 +1155,9 @@ class SyncService:
                     "errors": 0
                 }
 
-                page = 1
-                has_more = True
-
-                while has_more:
+                async def fetch_page(page):
                     print(f"📋 Fetching tasks page {page}...")
-
-                    response = await crm.get_records(
+                    return await crm.get_records(
                         module="Tasks",
                         page=page,
                         per_page=100,
@@ -868,31 +1169,16 @@ class SyncService:
                         ]
                     )
 
-                    tasks = response.get("data", [])
-                    info = response.get("info", {})
-
-                    for task_data in tasks:
-                        try:
-                            is_new = await cls._upsert_task_from_zoho(db, task_data)
-                            stats["total_fetched"] += 1
-                            if is_new:
-                                stats["created"] += 1
-                            else:
-                                stats["updated"] += 1
-                        except Exception as e:
-                            print(f"⚠️ Error syncing task {task_data.get('id')}: {e}")
-                            stats["errors"] += 1
-
-                    # Commit each page
-                    await db.commit()
+                async def write_page(tasks):
+                    # One explicit transaction per page
+                    async with db.begin():
+                        await cls._upsert_tasks_batch(db, tasks, stats)
 
-                    has_more = info.get("more_records", False)
-                    page += 1
+                def on_write_error(page, e):
+                    print(f"⚠️ Error writing tasks page {page}: {e}")
+                    stats["errors"] += 1
 
-                    # Safety limit
-                    if page > 50:
-                        print("⚠️ Reached page limit (50)")
-                        break
+                await cls._run_page_pipeline(fetch_page, write_page, on_write_error, max_pages=50)
 
                 # Update sync log
                 sync_log.status = "completed"
@@ -912,64 +1198,79 @@ class SyncService:
                 await db.commit()
                 raise
 
+    # Map Zoho task Status / Priority to ours
+    TASK_STATUS_MAP = {
+        "Not Started": "pending",
+        "In Progress": "in_progress",
+        "Completed": "completed",
+        "Deferred": "pending",
+        "Waiting for input": "pending"
+    }
+
+    TASK_PRIORITY_MAP = {
+        "High": "high",
+        "Highest": "high",
+        "Medium": "medium",
+        "Normal": "medium",
+        "Low": "low",
+        "Lowest": "low"
+    }
+
     @classmethod
-    async def _upsert_task_from_zoho(cls, db: AsyncSession, data: Dict[str, Any]) -> bool:
+    async def _upsert_tasks_batch(cls, db: AsyncSession, tasks: List[Dict[str, Any]], stats: Dict[str, Any]):
         """
-        Create or update a task from Zoho data.
-        Returns True if created, False if updated.
+        Upsert one page of Zoho tasks with a single ON CONFLICT statement.
+
+        Args:
+            db: Database session
+            tasks: Task records from one Zoho page
+            stats: Sync stats dict, updated in place
         """
-        zoho_task_id = str(data.get("id", ""))
-        if not zoho_task_id:
-            return False
+        rows, failures = [], []
+        now = datetime.utcnow()
+        for task_data in tasks:
+            try:
+                row = cls._task_row_from_zoho(task_data, now)
+                if row:
+                    rows.append(row)
+            except Exception as e:
+                failures.append((task_data.get('id'), e))
 
-        # Check if task exists
-        result = await db.execute(
-            select(Task).where(Task.zoho_task_id == zoho_task_id)
-        )
-        existing = result.scalar_one_or_none()
+        if rows:
+            created = await cls._upsert_rows(db, Task, "zoho_task_id", rows)
+            stats["total_fetched"] += len(rows)
+            stats["created"] += created
+            stats["updated"] += len(rows) - created
 
-        # Parse dates
-        due_date = cls._parse_date(data.get("Due_Date"))
-        closed_time = cls._parse_datetime(data.get("Closed_Time"))
+        # Counted only once the page is written, as a failed page is retried
+        for task_id, e in failures:
+            print(f"⚠️ Error syncing task {task_id}: {e}")
+            stats["errors"] += 1
 
-        # Get owner info
-        owner_data = data.get("Owner", {})
-        assigned_to = owner_data.get("name") if isinstance(owner_data, dict) else None
+    @classmethod
+    def _task_row_from_zoho(cls, data: Dict[str, Any], now: datetime) -> Optional[Dict[str, Any]]:
+        """
+        Build a tasks table row from Zoho task data (no DB access).
 
-        # Get creator info
-        creator_data = data.get("Created_By", {})
-        created_by = creator_data.get("name") if isinstance(creator_data, dict) else None
+        Args:
+            data: Zoho task record
+            now: Timestamp to stamp the row with
+
+        Returns:
+            Column dict, or None if the record has no id
+        """
+        zoho_task_id = data.get("id")
+        if not zoho_task_id:
+            return None
+
+        # Get owner and creator info
+        assigned_to = _ref(data, "Owner", "name")
+        created_by = _ref(data, "Created_By", "name")
 
         # Get related record (candidate)
-        what_id_data = data.get("What_Id")
-        zoho_candidate_id = None
-        candidate_name = None
-        if what_id_data and isinstance(what_id_data, dict):
-            zoho_candidate_id = what_id_data.get("id")
-            candidate_name = what_id_data.get("name")
-
-        # Map Zoho status to our status
-        zoho_status = data.get("Status", "Not Started")
-        status_map = {
-            "Not Started": "pending",
-            "In Progress": "in_progress",
-            "Completed": "completed",
-            "Deferred": "pending",
-            "Waiting for input": "pending"
-        }
-        status = status_map.get(zoho_status, "pending")
-
-        # Map priority
-        zoho_priority = data.get("Priority", "Medium")
-        priority_map = {
-            "High": "high",
-            "Highest": "high",
-            "Medium": "medium",
-            "Normal": "medium",
-            "Low": "low",
-            "Lowest": "low"
-        }
-        priority = priority_map.get(zoho_priority, "medium")
+        what_id = data.get("What_Id")
+        zoho_candidate_id = _ref(data, "What_Id")
+        candidate_name = what_id.get("name") if type(what_id) is dict else None
 
         # Determine task type from subject
         subject = data.get("Subject", "Task")
@@ -987,45 +1288,91 @@ class SyncService:
         else:
             task_type = "general"
 
-        if existing:
-            # Update existing task
-            existing.title = subject
-            existing.description = data.get("Description")
-            existing.task_type = task_type
-            existing.status = status
-            existing.priority = priority
-            existing.due_date = due_date
-            existing.assigned_to = assigned_to
-            existing.created_by = created_by
-            existing.zoho_candidate_id = zoho_candidate_id
-            existing.candidate_name = candidate_name
-            existing.completed_at = closed_time
-            existing.updated_at = datetime.utcnow()
-            return False
-        else:
-            # Create new task
-            new_task = Task(
-                zoho_task_id=zoho_task_id,
-                title=subject,
-                description=data.get("Description"),
-                task_type=task_type,
-                status=status,
-                priority=priority,
-                due_date=due_date,
-                assigned_to=assigned_to,
-                created_by=created_by,
-                zoho_candidate_id=zoho_candidate_id,
-                candidate_name=candidate_name,
-                completed_at=closed_time
-            )
-            db.add(new_task)
-            return True
+        return {
+            "zoho_task_id": str(zoho_task_id),
+            "title": subject,
+            "description": data.get("Description"),
+            "task_type": task_type,
+            "status": cls.TASK_STATUS_MAP.get(data.get("Status", "Not Started"), "pending"),
+            "priority": cls.TASK_PRIORITY_MAP.get(data.get("Priority", "Medium"), "medium"),
+            "due_date": cls._parse_date(data.get("Due_Date")),
+            "assigned_to": assigned_to,
+            "created_by": created_by,
+            "zoho_candidate_id": zoho_candidate_id,
+            "candidate_name": candidate_name,
+            "completed_at": cls._parse_datetime(data.get("Closed_Time")),
+            "updated_at": now,
+        }
+
+    @classmethod
+    async def _upsert_rows(
+        cls,
+        db: AsyncSession,
+        model,
+        key: str,
+        rows: List[Dict[str, Any]],
+        existing_keys: Optional[set] = None,
+        insert_only: tuple = (),
+        skip_unchanged: bool = False
+    ) -> int:
+        """
+        Insert or update rows keyed by a unique Zoho ID column with a single
+        INSERT ... ON CONFLICT DO UPDATE statement, executed via executemany.
+        Columns missing from the rows (id, created_at) keep their insert defaults.
+
+        Args:
+            db: Database session
+            model: Mapped model class (Task, CrmNote, CandidateEmail)
+            key: Name of the unique Zoho ID column
+            rows: Column dicts, all with the same keys
+            existing_keys: Keys already known to exist, if the caller has
+                looked them up (skips the lookup here)
+            insert_only: Columns written on insert but left alone on update
+            skip_unchanged: Only update rows whose values differ (ignoring
+                updated_at), so unchanged rows are not rewritten
+
+        Returns:
+            Number of rows that were newly created
+        """
+        table = model.__table__
+        key_column = table.c[key]
+        keys = [row[key] for row in rows]
+
+        if existing_keys is None:
+            # Each IN (...) value is a bound parameter, so keep lookups under SQLite's limit
+            existing_keys = set()
+            for chunk in _chunked(keys, SQLITE_MAX_VARIABLES):
+                result = await db.execute(select(key_column).where(key_column.in_(chunk)))
+                existing_keys.update(result.scalars().all())
+
+        stmt = sqlite_insert(table)
+        set_ = {
+            name: stmt.excluded[name]
+            for name in rows[0]
+            if name != key and name not in insert_only
+        }
+        where = None
+        if skip_unchanged:
+            where = or_(*(
+                table.c[name].is_distinct_from(stmt.excluded[name])
+                for name in set_
+                if name != "updated_at"
+            ))
+        await db.execute(
+            stmt.on_conflict_do_update(index_elements=[key_column], set_=set_, where=where),
+            rows
+        )
+
+        # A key repeated within the page is one insert followed by updates
+        return len(set(keys) - existing_keys)
 
     @classmethod
     def _parse_date(cls, date_str: Optional[str]) -> Optional[datetime]:
         """Parse a date string (YYYY-MM-DD) to datetime"""
         if not date_str:
             return None
+        if isinstance(date_str, str) and _ZOHO_DATE_RE.match(date_str):
+            return _parse_iso(date_str)
         try:
             return datetime.strptime(date_str, "%Y-%m-%d")
         except (ValueError, TypeError):
@@ -1036,27 +1383,16 @@ class SyncService:
         """Parse datetime value, handling various formats"""
         if not value:
             return None
-        try:
-            if isinstance(value, datetime):
-                return value.replace(tzinfo=None) if value.tzinfo else value
-            # Try ISO format
-            dt = datetime.fromisoformat(value.replace("Z", "+00:00").replace(" ", "T"))
-            return dt.replace(tzinfo=None) if dt.tzinfo else dt
-        except (ValueError, AttributeError, TypeError):
+        if isinstance(value, datetime):
+            return value.replace(tzinfo=None) if value.tzinfo else value
+        if not isinstance(value, str):
             return None
+        return _parse_iso(value)
 
     @classmethod
     async def get_last_task_sync(cls) -> Optional[datetime]:
         """Get the timestamp of the last successful task sync"""
-        async with async_session() as db:
-            result = await db.execute(
-                select(SyncLog)
-                .where(SyncLog.sync_type == "tasks", SyncLog.status == "completed")
-                .order_by(SyncLog.completed_at.desc())
-                .limit(1)
-            )
-            sync_log = result.scalar_one_or_none()
-            return sync_log.completed_at if sync_log else None
+        return (await cls.get_last_sync_times(["tasks"])).get("tasks")
 
     # ========================================================================
     # NOTES SYNC
@@ -1076,17 +1412,15 @@ class SyncService:
         if not content:
             return ""
 
-        import re
-
         # Remove script and style elements entirely (including content)
-        text = re.sub(r'<script[^>]*>.*?</script>', '', content, flags=re.DOTALL | re.IGNORECASE)
-        text = re.sub(r'<style[^>]*>.*?</style>', '', text, flags=re.DOTALL | re.IGNORECASE)
+        text = _HTML_SCRIPT_RE.sub('', content)
+        text = _HTML_STYLE_RE.sub('', text)
 
         # Remove HTML comments
-        text = re.sub(r'<!--.*?-->', '', text, flags=re.DOTALL)
+        text = _HTML_COMMENT_RE.sub('', text)
 
         # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
+        text = _HTML_TAG_RE.sub('', text)
 
         # Decode common HTML entities
         text = text.replace('&nbsp;', ' ')
@@ -1103,7 +1437,7 @@ class SyncService:
         text = text.replace('&ndash;', '–')
 
         # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
 
         return text.strip()
 
@@ -1130,25 +1464,22 @@ class SyncService:
         if len(content) <= max_length:
             return content
 
-        # Split into sentences (simple heuristic)
-        import re
-        sentences = re.split(r'(?<=[.!?])\s+', content)
-        sentences = [s.strip() for s in sentences if s.strip()]
-
-        if not sentences:
-            # No clear sentences, just truncate
-            return content[:max_length - 3].rsplit(' ', 1)[0] + "..."
-
-        first_sentence = sentences[0]
+        # Find the first and last sentence boundaries (simple heuristic) without
+        # splitting the whole note; content is stripped, so sentences are too
+        first_break = _SENTENCE_BREAK_RE.search(content)
+        first_sentence = content[:first_break.start()] if first_break else content
 
         # If just one sentence or first is long enough
-        if len(sentences) == 1 or len(first_sentence) >= max_length - 20:
+        if first_break is None or len(first_sentence) >= max_length - 20:
             if len(first_sentence) <= max_length:
                 return first_sentence
             return first_sentence[:max_length - 3].rsplit(' ', 1)[0] + "..."
 
         # Try to include first and last sentence
-        last_sentence = sentences[-1]
+        last_break = first_break
+        for last_break in _SENTENCE_BREAK_RE.finditer(content, first_break.end()):
+            pass
+        last_sentence = content[last_break.end():]
 
         # Avoid duplicating if first == last
         if first_sentence == last_sentence:
@@ -1177,47 +1508,32 @@ class SyncService:
         Returns:
             List of key phrases
         """
-        if not content or len(content) < 10:
+        if (
+            not content
+            or len(content) < _KEY_PHRASE_MIN_LENGTH
+            or content.count(' ') < _KEY_PHRASE_MIN_SPACES
+        ):
             return []
 
         try:
-            from rake_nltk import Rake
-
-            # Initialize RAKE with default settings
-            rake = Rake(
-                min_length=1,
-                max_length=3,
-                include_repeated_phrases=False
-            )
-
-            # Extract keywords
-            rake.extract_keywords_from_text(content)
-
-            # Get ranked phrases (returns list of tuples: (score, phrase))
-            ranked = rake.get_ranked_phrases_with_scores()
-
-            # Filter and return top phrases
-            phrases = []
-            seen = set()
-            for score, phrase in ranked[:max_phrases * 2]:  # Get more to filter
-                # Clean up phrase
-                phrase = phrase.strip().lower()
+            rake = _get_rake()
 
-                # Skip very short or already seen
-                if len(phrase) < 3 or phrase in seen:
-                    continue
-
-                # Skip common stopwords that might slip through
-                if phrase in {'the', 'and', 'for', 'with', 'this', 'that', 'from'}:
-                    continue
+            # The shared extractor keeps per-call state, and notes are processed
+            # in worker threads
+            with _RAKE_LOCK:
+                # Extract keywords
+                rake.extract_keywords_from_text(content)
 
-                seen.add(phrase)
-                phrases.append(phrase)
+                # Get ranked phrases (returns list of tuples: (score, phrase))
+                ranked = rake.get_ranked_phrases_with_scores()
 
-                if len(phrases) >= max_phrases:
-                    break
+            # Filter and return top phrases (get more to filter), skipping very
+            # short ones and common stopwords that might slip through
+            candidates = (phrase.strip().lower() for _, phrase in ranked[:max_phrases * 2])
+            phrases = (p for p in candidates if len(p) >= 3 and p not in _KEY_PHRASE_STOPWORDS)
 
-            return phrases
+            # dict.fromkeys de-duplicates while keeping rank order
+            return list(dict.fromkeys(phrases))[:max_phrases]
 
         except ImportError:
             # RAKE not installed, return empty
@@ -1274,12 +1590,13 @@ class SyncService:
                 "records_processed": 0,
                 "records_created": 0,
                 "records_updated": 0,
+                "records_skipped": 0,
                 "errors": 0,
                 "error_details": []
             }
 
             try:
-                crm = ZohoCRM()
+                crm = await get_zoho_api()
 
                 # Get last sync time for incremental sync
                 modified_since = None
@@ -1287,66 +1604,44 @@ class SyncService:
                     last_sync = await cls.get_last_notes_sync()
                     if last_sync:
                         # Format as ISO string for Zoho API
-                        modified_since = last_sync.strftime("%Y-%m-%dT%H:%M:%S+00:00")
+                        modified_since = (last_sync - cls.INCREMENTAL_SYNC_OVERLAP).strftime("%Y-%m-%dT%H:%M:%S+00:00")
                         print(f"📝 Incremental sync since: {modified_since}")
                     else:
                         print("📝 No previous sync found, performing full sync")
                 else:
                     print("📝 Full sync requested")
 
-                page = 1
                 per_page = 200
 
-                while True:
+                async def fetch_page(page):
                     try:
                         print(f"📝 Fetching notes page {page}...")
-
-                        response = await crm.get_all_notes(
+                        return await crm.get_all_notes(
                             page=page,
                             per_page=per_page,
                             modified_since=modified_since
                         )
-
-                        notes = response.get("data", [])
-                        if not notes:
-                            break
-
-                        for note_data in notes:
-                            try:
-                                created = await cls._upsert_note_from_zoho(db, note_data)
-                                stats["records_processed"] += 1
-                                if created:
-                                    stats["records_created"] += 1
-                                else:
-                                    stats["records_updated"] += 1
-                            except Exception as e:
-                                print(f"⚠️ Error processing note {note_data.get('id')}: {e}")
-                                stats["errors"] += 1
-                                stats["error_details"].append(str(e))
-
-                        # Commit each page
-                        await db.commit()
-
-                        # Check for more pages
-                        info = response.get("info", {})
-                        if not info.get("more_records", False):
-                            break
-
-                        page += 1
-
-                        # Safety limit
-                        if page > 100:
-                            print("⚠️ Reached page limit (100)")
-                            break
-
                     except Exception as e:
                         print(f"❌ Error fetching notes page {page}: {e}")
                         stats["errors"] += 1
                         stats["error_details"].append(f"Page {page}: {str(e)}")
-                        break
+                        return {}
 
-                # Mark sync as completed
-                sync_log.status = "completed"
+                async def write_page(notes):
+                    # One explicit transaction per page
+                    async with db.begin():
+                        await cls._upsert_notes_batch(db, notes, stats, skip_unchanged=not full_sync)
+
+                def on_write_error(page, e):
+                    print(f"❌ Error writing notes page {page}: {e}")
+                    stats["errors"] += 1
+                    stats["error_details"].append(f"Page {page}: {str(e)}")
+
+                await cls._run_page_pipeline(fetch_page, write_page, on_write_error, max_pages=100)
+
+                # A run that lost pages is partial, so it never becomes the
+                # watermark and the next incremental sync fetches them again
+                sync_log.status = "partial" if stats["errors"] else "completed"
                 sync_log.completed_at = datetime.utcnow()
                 sync_log.records_processed = stats["records_processed"]
                 sync_log.records_created = stats["records_created"]
@@ -1356,7 +1651,8 @@ class SyncService:
                 await db.commit()
 
                 print(f"✅ Notes sync complete: {stats['records_processed']} processed, "
-                      f"{stats['records_created']} created, {stats['records_updated']} updated")
+                      f"{stats['records_created']} created, {stats['records_updated']} updated, "
+                      f"{stats['records_skipped']} unchanged")
 
             except Exception as e:
                 sync_log.status = "failed"
@@ -1368,24 +1664,92 @@ class SyncService:
             return stats
 
     @classmethod
-    async def _upsert_note_from_zoho(cls, db: AsyncSession, data: Dict[str, Any]) -> bool:
+    async def _upsert_notes_batch(
+        cls,
+        db: AsyncSession,
+        notes: List[Dict[str, Any]],
+        stats: Dict[str, Any],
+        skip_unchanged: bool = True
+    ):
         """
-        Insert or update a CRM note from Zoho data.
+        Upsert one page of Zoho notes with a single ON CONFLICT statement.
 
-        Returns:
-            True if created, False if updated
+        Args:
+            db: Database session
+            notes: Note records from one Zoho page
+            stats: Sync stats dict, updated in place
+            skip_unchanged: If True, notes whose Modified_Time matches the stored
+                row are counted as skipped without re-running HTML stripping,
+                summarizing and key phrase extraction
         """
         from app.models.database_models import CrmNote
 
-        zoho_note_id = str(data.get("id", ""))
-        if not zoho_note_id:
-            return False
+        # Stored modified times for this page, in one query
+        ids = [str(n["id"]) for n in notes if n.get("id")]
+        existing_modified = {}
+        for chunk in _chunked(ids, SQLITE_MAX_VARIABLES):
+            result = await db.execute(
+                select(CrmNote.zoho_note_id, CrmNote.zoho_modified_time)
+                .where(CrmNote.zoho_note_id.in_(chunk))
+            )
+            existing_modified.update(result.tuples().all())
 
-        # Check if exists
-        result = await db.execute(
-            select(CrmNote).where(CrmNote.zoho_note_id == zoho_note_id)
-        )
-        existing = result.scalar_one_or_none()
+        now = datetime.utcnow()
+
+        def build_rows():
+            # CPU-bound (HTML stripping, summary, RAKE): runs in a worker thread
+            rows, unchanged, failures = [], 0, []
+            for note_data in notes:
+                try:
+                    if skip_unchanged and existing_modified:
+                        modified_time = cls._parse_datetime(note_data.get("Modified_Time"))
+                        if modified_time and existing_modified.get(str(note_data.get("id"))) == modified_time:
+                            unchanged += 1
+                            continue
+
+                    row = cls._note_row_from_zoho(note_data, now)
+                    if row:
+                        rows.append(row)
+                except Exception as e:
+                    failures.append((note_data.get("id"), e))
+            return rows, unchanged, failures
+
+        # Process off the event loop so the next page can be fetched meanwhile
+        rows, unchanged, failures = await asyncio.to_thread(build_rows)
+
+        if rows:
+            created = await cls._upsert_rows(
+                db, CrmNote, "zoho_note_id", rows, existing_keys=set(existing_modified)
+            )
+            stats["records_processed"] += len(rows)
+            stats["records_created"] += created
+            stats["records_updated"] += len(rows) - created
+
+        # Counted only once the page is written, as a failed page is retried
+        stats["records_processed"] += unchanged
+        stats["records_skipped"] += unchanged
+        for note_id, e in failures:
+            print(f"⚠️ Error processing note {note_id}: {e}")
+            stats["errors"] += 1
+            stats["error_details"].append(str(e))
+
+    @classmethod
+    def _note_row_from_zoho(cls, data: Dict[str, Any], now: datetime) -> Optional[Dict[str, Any]]:
+        """
+        Build a crm_notes table row from Zoho note data (no DB access).
+        Strips HTML from the content and generates the summary and key phrases.
+
+        Args:
+            data: Zoho note record
+            now: Timestamp to stamp the row with
+
+        Returns:
+            Column dict, or None if the record has no id
+        """
+        zoho_note_id = data.get("id")
+        if not zoho_note_id:
+            return None
+        zoho_note_id = str(zoho_note_id)
 
         # Parse data and strip HTML from content
         title = data.get("Note_Title") or ""
@@ -1397,76 +1761,47 @@ class SyncService:
             print(f"📝 Stripped HTML from note {zoho_note_id}: {len(raw_content_original)} -> {len(raw_content)} chars")
 
         # Get parent (candidate) info
-        parent_id_data = data.get("Parent_Id")
-        zoho_candidate_id = None
-        if parent_id_data:
-            if isinstance(parent_id_data, dict):
-                zoho_candidate_id = parent_id_data.get("id")
-            else:
-                zoho_candidate_id = str(parent_id_data)
-
-        parent_module = data.get("$se_module", "Leads")
+        zoho_candidate_id = _ref(data, "Parent_Id")
 
         # Get owner info
-        owner_data = data.get("Owner", {})
-        created_by = owner_data.get("name") if isinstance(owner_data, dict) else str(owner_data) if owner_data else None
-
-        # Parse dates
-        created_time = cls._parse_datetime(data.get("Created_Time"))
-        modified_time = cls._parse_datetime(data.get("Modified_Time"))
+        created_by = _ref(data, "Owner", "name")
 
         # Generate summary and extract key phrases
-        summary = cls.summarize_note(raw_content)
         phrases = cls.extract_key_phrases(raw_content)
-        key_phrases_str = ', '.join(phrases) if phrases else None
 
-        if existing:
-            # Update existing note
-            existing.title = title
-            existing.raw_content = raw_content
-            existing.summary = summary
-            existing.key_phrases = key_phrases_str
-            existing.zoho_candidate_id = zoho_candidate_id
-            existing.parent_module = parent_module
-            existing.created_by = created_by
-            existing.zoho_created_time = created_time
-            existing.zoho_modified_time = modified_time
-            existing.updated_at = datetime.utcnow()
-            return False
-        else:
-            # Create new note
-            new_note = CrmNote(
-                zoho_note_id=zoho_note_id,
-                zoho_candidate_id=zoho_candidate_id,
-                parent_module=parent_module,
-                title=title,
-                raw_content=raw_content,
-                summary=summary,
-                key_phrases=key_phrases_str,
-                created_by=created_by,
-                zoho_created_time=created_time,
-                zoho_modified_time=modified_time
-            )
-            db.add(new_note)
-            return True
+        return {
+            "zoho_note_id": zoho_note_id,
+            "zoho_candidate_id": zoho_candidate_id,
+            "parent_module": data.get("$se_module", "Leads"),
+            "title": title,
+            "raw_content": raw_content,
+            "summary": cls.summarize_note(raw_content),
+            "key_phrases": ', '.join(phrases) if phrases else None,
+            "created_by": created_by,
+            "zoho_created_time": cls._parse_datetime(data.get("Created_Time")),
+            "zoho_modified_time": cls._parse_datetime(data.get("Modified_Time")),
+            "updated_at": now,
+        }
 
     @classmethod
     async def get_last_notes_sync(cls) -> Optional[datetime]:
-        """Get the timestamp of the last successful notes sync"""
-        async with async_session() as db:
-            result = await db.execute(
-                select(SyncLog)
-                .where(SyncLog.sync_type == "notes", SyncLog.status == "completed")
-                .order_by(SyncLog.completed_at.desc())
-                .limit(1)
-            )
-            sync_log = result.scalar_one_or_none()
-            return sync_log.completed_at if sync_log else None
+        """Get the start time of the last successful notes sync (the incremental watermark)"""
+        return await cls.get_sync_watermark("notes")
 
     # ========================================================================
     # EMAIL SYNC
     # ========================================================================
 
+    # Max candidates whose emails are fetched from Zoho at the same time
+    EMAIL_SYNC_CONCURRENCY = 5
+
+    # Emails per Zoho page, and the most pages fetched per candidate
+    EMAIL_PAGE_SIZE = 100
+    EMAIL_MAX_PAGES = 10
+
+    # Most cached emails returned by an on-demand candidate sync
+    EMAIL_RETURN_LIMIT = 200
+
     @classmethod
     async def sync_emails_from_zoho(cls, days_back: int = 30, limit_candidates: Optional[int] = None) -> Dict[str, Any]:
         """
@@ -1504,7 +1839,7 @@ class SyncService:
             }
 
             try:
-                crm = ZohoCRM()
+                crm = await get_zoho_api()
 
                 # Get active candidates (those in active pipeline stages)
                 active_stages = [
@@ -1512,7 +1847,8 @@ class SyncService:
                     "Interview Completed", "Assessment", "Onboarding", "Active"
                 ]
 
-                query = select(CandidateCache).where(
+                # Only the Zoho ID and module are needed, so skip loading full rows
+                query = select(CandidateCache.zoho_id, CandidateCache.zoho_module).where(
                     CandidateCache.stage.in_(active_stages)
                 ).order_by(CandidateCache.last_activity_date.desc())
 
@@ -1520,32 +1856,75 @@ class SyncService:
                     query = query.limit(limit_candidates)
 
                 result = await db.execute(query)
-                candidates = result.scalars().all()
+                candidates = result.all()
 
                 print(f"📧 Processing emails for {len(candidates)} active candidates...")
 
-                for candidate in candidates:
+                # Most fetched emails are already cached; load the known IDs of the
+                # candidates being synced once instead of looking them up per candidate
+                known_email_ids = set()
+                for chunk in _chunked([zoho_id for zoho_id, _ in candidates], SQLITE_MAX_VARIABLES):
+                    result = await db.execute(
+                        select(CandidateEmail.zoho_email_id)
+                        .where(CandidateEmail.zoho_candidate_id.in_(chunk))
+                    )
+                    known_email_ids.update(result.scalars().all())
+
+                # Zoho requests are I/O bound, so fetch several candidates at
+                # once; writes stay on this session as each fetch finishes
+                cutoff_date = datetime.utcnow() - timedelta(days=days_back)
+                semaphore = asyncio.Semaphore(cls.EMAIL_SYNC_CONCURRENCY)
+
+                async def fetch_candidate(zoho_id: str, module: str):
+                    # A failure is returned, not raised, so it stays tied to its candidate
+                    fetch_errors = []
                     try:
-                        candidate_stats = await cls._sync_emails_for_single_candidate(
-                            db, crm, candidate.zoho_id, candidate.zoho_module, days_back
-                        )
-                        stats["candidates_processed"] += 1
-                        stats["emails_processed"] += candidate_stats["processed"]
-                        stats["emails_created"] += candidate_stats["created"]
-                        stats["emails_updated"] += candidate_stats["updated"]
+                        async with semaphore:
+                            emails = await cls._fetch_emails_for_candidate(
+                                crm, zoho_id, module, cutoff_date, fetch_errors
+                            )
+                    except Exception as e:
+                        return zoho_id, module, e, fetch_errors
+                    return zoho_id, module, emails, fetch_errors
 
-                        # Commit every 10 candidates to avoid holding locks
-                        if stats["candidates_processed"] % 10 == 0:
+                fetches = [
+                    asyncio.create_task(fetch_candidate(zoho_id, module))
+                    for zoho_id, module in candidates
+                ]
+
+                try:
+                    for fetch in asyncio.as_completed(fetches):
+                        zoho_id, module, emails, fetch_errors = await fetch
+                        # Pages that failed to fetch; the emails read before them are still written
+                        stats["errors"] += len(fetch_errors)
+                        stats["error_details"].extend(fetch_errors)
+                        try:
+                            if isinstance(emails, Exception):
+                                raise emails
+                            candidate_stats = await cls._write_emails_for_candidate(
+                                db, emails, zoho_id, module, known_email_ids
+                            )
+                            # Commit each candidate as it finishes, so a failure only
+                            # loses that candidate's emails and no lock is held between
                             await db.commit()
-                            print(f"📧 Progress: {stats['candidates_processed']}/{len(candidates)} candidates")
 
-                    except Exception as e:
-                        print(f"⚠️ Error syncing emails for {candidate.zoho_id}: {e}")
-                        stats["errors"] += 1
-                        stats["error_details"].append(f"{candidate.zoho_id}: {str(e)[:100]}")
+                            stats["candidates_processed"] += 1
+                            stats["emails_processed"] += candidate_stats["processed"]
+                            stats["emails_created"] += candidate_stats["created"]
+                            stats["emails_updated"] += candidate_stats["updated"]
 
-                # Final commit
-                await db.commit()
+                            if stats["candidates_processed"] % 10 == 0:
+                                print(f"📧 Progress: {stats['candidates_processed']}/{len(candidates)} candidates")
+
+                        except Exception as e:
+                            await db.rollback()
+                            print(f"⚠️ Error syncing emails for {zoho_id}: {e}")
+                            stats["errors"] += 1
+                            stats["error_details"].append(f"{zoho_id}: {str(e)[:100]}")
+                finally:
+                    # Only reached with tasks pending if the loop was aborted
+                    for fetch in fetches:
+                        fetch.cancel()
 
                 # Update sync log
                 sync_log.status = "completed"
@@ -1590,60 +1969,141 @@ class SyncService:
             days_back: How many days of history to fetch
 
         Returns:
-            Dict with processed/created/updated counts
+            Dict with processed/created/updated counts and fetch errors
+        """
+        cutoff_date = datetime.utcnow() - timedelta(days=days_back)
+        fetch_errors = []
+        emails = await cls._fetch_emails_for_candidate(
+            crm, zoho_candidate_id, module, cutoff_date, fetch_errors
+        )
+        stats = await cls._write_emails_for_candidate(db, emails, zoho_candidate_id, module)
+        stats["errors"] = len(fetch_errors)
+        return stats
+
+    @classmethod
+    async def _fetch_emails_for_candidate(
+        cls,
+        crm: ZohoCRM,
+        zoho_candidate_id: str,
+        module: str,
+        cutoff_date: datetime,
+        errors: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch a candidate's emails from Zoho, dropping those older than the cutoff.
+
+        A failed page is logged and ends the fetch, keeping the emails read so far.
+
+        Args:
+            crm: Zoho CRM client
+            zoho_candidate_id: Candidate's Zoho ID
+            module: CRM module (Leads or Contacts)
+            cutoff_date: Oldest email time to keep
+            errors: If given, a message for a failed page fetch is appended to it
+
+        Returns:
+            List of Zoho email records
         """
-        stats = {"processed": 0, "created": 0, "updated": 0}
+        # Let Zoho drop older emails itself where it honours If-Modified-Since
+        modified_since = cutoff_date.strftime("%Y-%m-%dT%H:%M:%S+00:00")
+
+        async def fetch_page(page: int):
+            response = await crm.get_emails_for_record(
+                module=module,
+                record_id=zoho_candidate_id,
+                page=page,
+                per_page=cls.EMAIL_PAGE_SIZE,
+                modified_since=modified_since
+            )
+            # Zoho returns emails in 'email_related_list' (not 'data' like other modules)
+            return response.get("email_related_list", response.get("data", [])), response.get("info", {})
+
+        emails_to_sync = []
+
+        def keep_recent(emails: List[Dict[str, Any]]) -> bool:
+            """Keep emails inside the window; True if the whole page was older"""
+            all_older = True
+            for email_data in emails:
+                # Skip emails older than cutoff (for batch sync)
+                email_time = cls._email_sent_at(email_data)
+                if email_time and email_time < cutoff_date:
+                    continue
+                all_older = False
+                emails_to_sync.append(email_data)
+            return all_older
 
         page = 1
-        cutoff_date = datetime.utcnow() - timedelta(days=days_back)
 
-        while True:
+        while page <= cls.EMAIL_MAX_PAGES:
             try:
-                response = await crm.get_emails_for_record(
-                    module=module,
-                    record_id=zoho_candidate_id,
-                    page=page,
-                    per_page=100
-                )
+                emails, info = await fetch_page(page)
+            except Exception as e:
+                print(f"⚠️ Error fetching emails page {page} for {zoho_candidate_id}: {e}")
+                if errors is not None:
+                    errors.append(f"{zoho_candidate_id}: page {page}: {str(e)[:100]}")
+                break
 
-                # Zoho returns emails in 'email_related_list' (not 'data' like other modules)
-                emails = response.get("email_related_list", response.get("data", []))
-                if not emails:
-                    break
+            if not emails:
+                break
 
-                for email_data in emails:
-                    # Parse email date
-                    email_time = cls._parse_email_datetime(email_data.get("Date_Time") or email_data.get("Time"))
+            # The list's sort order is not guaranteed, so one old email says nothing
+            # about later pages; only stop early once a whole page is out of the window
+            if keep_recent(emails) or not info.get("more_records", False):
+                break
 
-                    # Skip emails older than cutoff (for batch sync)
-                    if email_time and email_time < cutoff_date:
-                        continue
+            page += 1
 
-                    created = await cls._upsert_email_from_zoho(
-                        db, email_data, zoho_candidate_id, module
-                    )
-                    stats["processed"] += 1
-                    if created:
-                        stats["created"] += 1
-                    else:
-                        stats["updated"] += 1
+        return emails_to_sync
 
-                # Check for more pages
-                info = response.get("info", {})
-                if not info.get("more_records", False):
-                    break
+    @classmethod
+    async def _write_emails_for_candidate(
+        cls,
+        db: AsyncSession,
+        emails: List[Dict[str, Any]],
+        zoho_candidate_id: str,
+        module: str,
+        known_email_ids: Optional[set] = None
+    ) -> Dict[str, int]:
+        """
+        Upsert a candidate's fetched emails into the cache.
 
-                page += 1
+        Args:
+            db: Database session
+            emails: Zoho email records
+            zoho_candidate_id: Candidate's Zoho ID
+            module: CRM module (Leads or Contacts)
+            known_email_ids: Every zoho_email_id already cached, if the caller
+                has loaded them (skips the lookup); new IDs are added to it
 
-                # Safety limit
-                if page > 10:
-                    break
+        Returns:
+            Dict with processed/created/updated counts
+        """
+        from app.models.database_models import CandidateEmail
 
-            except Exception as e:
-                print(f"⚠️ Error fetching emails page {page} for {zoho_candidate_id}: {e}")
-                break
+        now = datetime.utcnow()
+        rows = [
+            row for row in (
+                cls._email_row_from_zoho(email_data, zoho_candidate_id, module, now)
+                for email_data in emails
+            )
+            if row
+        ]
 
-        return stats
+        created = 0
+        if rows:
+            # Keep the owning candidate on emails shared between candidates, and
+            # keep full bodies cached by the email content endpoint
+            created = await cls._upsert_rows(
+                db, CandidateEmail, "zoho_email_id", rows,
+                existing_keys=known_email_ids,
+                insert_only=("zoho_candidate_id", "parent_module", "source", "body_full"),
+                skip_unchanged=True
+            )
+            if known_email_ids is not None:
+                known_email_ids.update(row["zoho_email_id"] for row in rows)
+
+        # Emails without an id are skipped but still counted, as before
+        return {"processed": len(emails), "created": created, "updated": len(emails) - created}
 
     @classmethod
     async def sync_emails_for_candidate(
@@ -1669,7 +2129,7 @@ class SyncService:
         print(f"📧 On-demand email sync for {zoho_candidate_id} (include_history={include_history})...")
 
         async with async_session() as db:
-            crm = ZohoCRM()
+            crm = await get_zoho_api()
 
             # Determine how far back to fetch
             if include_history:
@@ -1685,30 +2145,32 @@ class SyncService:
 
             await db.commit()
 
-            # Return the cached emails
+            # Return the most recent cached emails (index-ordered, no sort)
             result = await db.execute(
                 select(CandidateEmail)
                 .where(CandidateEmail.zoho_candidate_id == zoho_candidate_id)
                 .order_by(CandidateEmail.sent_at.desc())
+                .limit(cls.EMAIL_RETURN_LIMIT + 1)
             )
             emails = result.scalars().all()
 
             return {
                 "stats": stats,
-                "emails": emails,
-                "total_count": len(emails)
+                "emails": emails[:cls.EMAIL_RETURN_LIMIT],
+                "total_count": min(len(emails), cls.EMAIL_RETURN_LIMIT),
+                "has_more": len(emails) > cls.EMAIL_RETURN_LIMIT
             }
 
     @classmethod
-    async def _upsert_email_from_zoho(
+    def _email_row_from_zoho(
         cls,
-        db: AsyncSession,
         data: Dict[str, Any],
         zoho_candidate_id: str,
-        module: str
-    ) -> bool:
+        module: str,
+        now: datetime
+    ) -> Optional[Dict[str, Any]]:
         """
-        Insert or update an email record from Zoho CRM data.
+        Build a candidate_emails table row from Zoho email data (no DB access).
 
         Zoho email_related_list structure:
         {
@@ -1723,58 +2185,25 @@ class SyncService:
             "owner": {"name": "Owner Name", "id": "123"}
         }
 
+        Args:
+            data: Zoho email record
+            zoho_candidate_id: Candidate's Zoho ID
+            module: CRM module (Leads or Contacts)
+            now: Timestamp to stamp the row with
+
         Returns:
-            True if created, False if updated
+            Column dict, or None if the email has no id
         """
-        from app.models.database_models import CandidateEmail
-
         # Get unique email identifier - Zoho uses 'message_id' for emails
         zoho_email_id = str(data.get("message_id", "") or data.get("id", "") or data.get("Message_Id", ""))
         if not zoho_email_id:
-            return False
-
-        # Check if exists
-        result = await db.execute(
-            select(CandidateEmail).where(CandidateEmail.zoho_email_id == zoho_email_id)
-        )
-        existing = result.scalar_one_or_none()
-
-        # Parse email data - Zoho uses lowercase keys
-        from_data = data.get("from") or data.get("From") or {}
-        to_data = data.get("to") or data.get("To") or []
+            return None
 
-        # Handle From field (dict with email key)
-        if isinstance(from_data, dict):
-            from_address = from_data.get("email", "") or from_data.get("Email", "")
-        else:
-            from_address = str(from_data) if from_data else ""
-
-        # Handle To field (list of dicts)
-        if isinstance(to_data, list):
-            to_addresses = []
-            for t in to_data:
-                if isinstance(t, dict):
-                    to_addresses.append(t.get("email", "") or t.get("Email", ""))
-                else:
-                    to_addresses.append(str(t))
-            to_address = "; ".join(filter(None, to_addresses))
-        elif isinstance(to_data, dict):
-            to_address = to_data.get("email", "") or to_data.get("Email", "")
-        else:
-            to_address = str(to_data) if to_data else ""
-
-        # Handle CC field
-        cc_data = data.get("Cc") or data.get("cc") or []
-        if isinstance(cc_data, list):
-            cc_addresses = []
-            for c in cc_data:
-                if isinstance(c, dict):
-                    cc_addresses.append(c.get("email", "") or c.get("Email", ""))
-                else:
-                    cc_addresses.append(str(c))
-            cc_address = "; ".join(filter(None, cc_addresses)) or None
-        else:
-            cc_address = str(cc_data) if cc_data else None
+        # Parse addresses - Zoho uses lowercase keys, From is a dict and
+        # To/Cc are lists of dicts
+        from_address = _email_address(data.get("from") or data.get("From"))
+        to_address = _email_addresses(data.get("to") or data.get("To"))
+        cc_address = _email_addresses(data.get("Cc") or data.get("cc")) or None
 
         # Subject (Zoho uses lowercase)
         subject = data.get("subject") or data.get("Subject") or ""
@@ -1783,12 +2212,7 @@ class SyncService:
         body_snippet = data.get("snippet") or ""
         body_full = ""  # Would need separate API call for full body
 
-        # Parse sent date - Zoho uses 'sent_time' for emails
-        sent_at = cls._parse_email_datetime(
-            data.get("sent_time") or data.get("Sent_Time") or data.get("Date_Time") or data.get("Time")
-        )
-        if not sent_at:
-            sent_at = datetime.utcnow()
+        sent_at = cls._email_sent_at(data) or now
 
         # Determine direction - Zoho uses 'sent' boolean (true = outbound from CRM)
         if data.get("sent") is True:
@@ -1812,66 +2236,59 @@ class SyncService:
         message_id = data.get("Message_Id") or data.get("message_id")
         thread_id = data.get("Thread_Id") or data.get("thread_id")
 
-        if existing:
-            # Update existing
-            existing.from_address = from_address
-            existing.to_address = to_address
-            existing.cc_address = cc_address
-            existing.subject = subject
-            existing.body_snippet = body_snippet
-            existing.body_full = body_full
-            existing.sent_at = sent_at
-            existing.direction = direction
-            existing.has_attachment = has_attachment
-            existing.message_id = message_id
-            existing.thread_id = thread_id
-            existing.updated_at = datetime.utcnow()
-            return False
-        else:
-            # Create new
-            new_email = CandidateEmail(
-                zoho_email_id=zoho_email_id,
-                zoho_candidate_id=zoho_candidate_id,
-                parent_module=module,
-                direction=direction,
-                from_address=from_address,
-                to_address=to_address,
-                cc_address=cc_address,
-                subject=subject,
-                body_snippet=body_snippet,
-                body_full=body_full,
-                sent_at=sent_at,
-                has_attachment=has_attachment,
-                message_id=message_id,
-                thread_id=thread_id,
-                source="crm"
-            )
-            db.add(new_email)
-            return True
+        return {
+            "zoho_email_id": zoho_email_id,
+            "zoho_candidate_id": zoho_candidate_id,
+            "parent_module": module,
+            "direction": direction,
+            "from_address": from_address,
+            "to_address": to_address,
+            "cc_address": cc_address,
+            "subject": subject,
+            "body_snippet": body_snippet,
+            "body_full": body_full,
+            "sent_at": sent_at,
+            "has_attachment": has_attachment,
+            "message_id": message_id,
+            "thread_id": thread_id,
+            "source": "crm",
+            "updated_at": now,
+        }
+
+    @classmethod
+    def _email_sent_at(cls, data: Dict[str, Any]) -> Optional[datetime]:
+        """Parse when a Zoho email was sent - Zoho uses 'sent_time' for emails"""
+        return cls._parse_email_datetime(
+            data.get("sent_time") or data.get("Sent_Time") or data.get("Date_Time") or data.get("Time")
+        )
 
     @classmethod
     def _parse_email_datetime(cls, value) -> Optional[datetime]:
         """Parse email datetime from various Zoho formats"""
         if not value:
             return None
-        try:
-            if isinstance(value, datetime):
-                return value.replace(tzinfo=None) if value.tzinfo else value
-
-            # Try ISO format
-            dt = datetime.fromisoformat(value.replace("Z", "+00:00").replace(" ", "T"))
-            return dt.replace(tzinfo=None) if dt.tzinfo else dt
-        except (ValueError, AttributeError, TypeError):
+        if isinstance(value, datetime):
+            return value.replace(tzinfo=None) if value.tzinfo else value
+        if not isinstance(value, str):
             return None
+        # Shares the cached regex fast path with the other sync parsers
+        return _parse_iso(value)
 
     @classmethod
-    async def get_email_thread_for_candidate(cls, zoho_candidate_id: str) -> Dict[str, Any]:
+    async def get_email_thread_for_candidate(
+        cls,
+        zoho_candidate_id: str,
+        include_emails: bool = True
+    ) -> Dict[str, Any]:
         """
         Get all emails for a candidate in chronological order.
         Designed for AI analysis to detect missed replies, stalled conversations, etc.
 
         Args:
             zoho_candidate_id: Candidate's Zoho ID
+            include_emails: If False, return only the analysis metadata
+                (emails is an empty list), computed with one aggregate query
+                instead of loading the email rows
 
         Returns:
             Dict with emails in chronological order and analysis metadata
@@ -1879,15 +2296,42 @@ class SyncService:
         from app.models.database_models import CandidateEmail
 
         async with async_session() as db:
-            # Get all emails for this candidate, oldest first (chronological)
-            result = await db.execute(
-                select(CandidateEmail)
-                .where(CandidateEmail.zoho_candidate_id == zoho_candidate_id)
-                .order_by(CandidateEmail.sent_at.asc())
-            )
-            emails = result.scalars().all()
+            emails = []
+            if include_emails:
+                # Get all emails for this candidate, oldest first (chronological)
+                result = await db.execute(
+                    select(CandidateEmail)
+                    .where(CandidateEmail.zoho_candidate_id == zoho_candidate_id)
+                    .order_by(CandidateEmail.sent_at.asc())
+                )
+                emails = result.scalars().all()
+                total_count = len(emails)
 
-            if not emails:
+                # Find last inbound and outbound from the rows already loaded
+                last_inbound = None
+                last_outbound = None
+
+                for email in reversed(emails):  # Start from most recent
+                    if email.direction == "inbound" and not last_inbound:
+                        last_inbound = email.sent_at
+                    elif email.direction == "outbound" and not last_outbound:
+                        last_outbound = email.sent_at
+
+                    if last_inbound and last_outbound:
+                        break
+            else:
+                # Count and last inbound/outbound times in one aggregate query
+                result = await db.execute(
+                    select(
+                        func.count(CandidateEmail.id),
+                        func.max(CandidateEmail.sent_at).filter(CandidateEmail.direction == "inbound"),
+                        func.max(CandidateEmail.sent_at).filter(CandidateEmail.direction == "outbound"),
+                    )
+                    .where(CandidateEmail.zoho_candidate_id == zoho_candidate_id)
+                )
+                total_count, last_inbound, last_outbound = result.one()
+
+            if not total_count:
                 return {
                     "candidate_id": zoho_candidate_id,
                     "emails": [],
@@ -1898,19 +2342,6 @@ class SyncService:
                     "needs_followup": False
                 }
 
-            # Find last inbound and outbound
-            last_inbound = None
-            last_outbound = None
-
-            for email in reversed(emails):  # Start from most recent
-                if email.direction == "inbound" and not last_inbound:
-                    last_inbound = email.sent_at
-                elif email.direction == "outbound" and not last_outbound:
-                    last_outbound = email.sent_at
-
-                if last_inbound and last_outbound:
-                    break
-
             # Calculate days since last response
             days_since_last_response = None
             needs_followup = False
@@ -1930,17 +2361,16 @@ class SyncService:
 
             # Get candidate name
             candidate_result = await db.execute(
-                select(CandidateCache)
+                select(CandidateCache.full_name)
                 .where(CandidateCache.zoho_id == zoho_candidate_id)
             )
-            candidate = candidate_result.scalar_one_or_none()
-            candidate_name = candidate.full_name if candidate else None
+            candidate_name = candidate_result.scalar_one_or_none()
 
             return {
                 "candidate_id": zoho_candidate_id,
                 "candidate_name": candidate_name,
                 "emails": emails,
-                "total_count": len(emails),
+                "total_count": total_count,
                 "last_inbound_at": last_inbound,
                 "last_outbound_at": last_outbound,
                 "days_since_last_response": days_since_last_response,
@@ -1950,12 +2380,4 @@ class SyncService:
     @classmethod
     async def get_last_email_sync(cls) -> Optional[datetime]:
         """Get the timestamp of the last successful email sync"""
-        async with async_session() as db:
-            result = await db.execute(
-                select(SyncLog)
-                .where(SyncLog.sync_type == "emails", SyncLog.status == "completed")
-                .order_by(SyncLog.completed_at.desc())
-                .limit(1)
-            )
-            sync_log = result.scalar_one_or_none()
-            return sync_log.completed_at if sync_log else None
+        return (await cls.get_last_sync_times(["emails"])).get("emails")
@@ -10,16 +10,11 @@ import os
 import sys
 import httpx
 from pathlib import Path
+from dotenv import load_dotenv
 
 # Load .env file
 env_path = Path(__file__).parent.parent / ".env"
-if env_path.exists():
-    with open(env_path) as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith("#") and "=" in line:
-                key, value = line.split("=", 1)
-                os.environ[key.strip()] = value.strip()
+load_dotenv(env_path, override=True)
 
 # Get credentials from environment
 CLIENT_ID = os.getenv("ZOHO_CLIENT_ID")
@@ -28,11 +23,11 @@ REFRESH_TOKEN = os.getenv("ZOHO_REFRESH_TOKEN")
 ACCOUNTS_DOMAIN = os.getenv("ZOHO_ACCOUNTS_DOMAIN", "https://accounts.zoho.com")
 API_DOMAIN = os.getenv("ZOHO_API_DOMAIN", "https://www.zohoapis.com")
 
-def get_access_token():
+def get_access_token(client):
     """Get access token using refresh token"""
     print("🔑 Getting access token...")
 
-    response = httpx.post(
+    response = client.post(
         f"{ACCOUNTS_DOMAIN}/oauth/v2/token",
         params={
             "refresh_token": REFRESH_TOKEN,
@@ -50,13 +45,13 @@ def get_access_token():
     print("✅ Got access token")
     return data["access_token"]
 
-def get_leads(token, count=5):
+def get_leads(client, token, count=5):
     """Fetch a few leads to inspect their fields"""
     print(f"\n📥 Fetching {count} leads from Zoho CRM...")
 
     headers = {"Authorization": f"Zoho-oauthtoken {token}"}
 
-    response = httpx.get(
+    response = client.get(
         f"{API_DOMAIN}/crm/v2/Leads",
         headers=headers,
         params={"per_page": count}
@@ -79,9 +74,10 @@ def main():
         print(f"   Looking for .env at: {env_path}")
         sys.exit(1)
 
-    # Get token and fetch leads
-    token = get_access_token()
-    data = get_leads(token, count=5)
+    # Get token and fetch leads, reusing one client's connection pool
+    with httpx.Client() as client:
+        token = get_access_token(client)
+        data = get_leads(client, token, count=5)
 
     records = data.get("data", [])
     print(f"✅ Got {len(records)} leads\n")